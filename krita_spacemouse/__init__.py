@@ -1,11 +1,20 @@
-from krita import Krita
-from .extension import SpacenavControlExtension
+try:
+    from krita import Krita
+except ImportError:  # Imported outside Krita, e.g. by the krita_spacemouse.bench harness
+    Krita = None
 
 def initialize():
+    if Krita is None:
+        return
+    from .utils import timed_phase
+    with timed_phase("import"):
+        from .extension import SpacenavControlExtension
     app = Krita.instance()
     if app:
         # Register the extension
-        app.addExtension(SpacenavControlExtension(app))
+        with timed_phase("extension.__init__"):
+            extension = SpacenavControlExtension(app)
+        app.addExtension(extension)
         print("Krita_Spacemouse plugin v1.0 registered")
 
         # Optional: Log successful initialization for debugging
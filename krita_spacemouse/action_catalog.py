@@ -0,0 +1,133 @@
+# action_catalog.py
+from collections import namedtuple
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from PyQt5.QtGui import QIcon
+from krita import Krita
+from .utils import debug_print
+
+# First matching category wins, so the specific categories come before the broad "Menu" prefixes; anything unmatched lands in "Other"
+ACTION_CATEGORIES = {
+    "Krita": ["krita_", "animation", "blending", "filter", "general", "layer", "painting", "setting", "wg_"],
+    "Edit": ["edit_undo", "edit_redo", "edit_cut", "edit_copy", "edit_paste"],
+    "Selection": ["select_", "deselect", "invert_selection"],
+    "View": ["store_view_", "recall_view_", "lock_", "view_zoom", "zoom_to", "reset_canvas", "mirror", "rotate_canvas", "show"],
+    "Modifiers": ["Shift", "Ctrl", "Alt", "Super", "Meta"],
+    "Menu": ["brushes", "edit_", "file_", "help_", "image_", "view_", "window_"],
+    "Recorder": ["recorder_"],
+    "Scripts": ["ai_", "python_", "ten_"],
+    "SVG Tools": ["svg_"],
+    "Tools": ["tool_", "kis_tool"],
+    "Other": []
+}
+# Actions the plugin implements itself; they have no QAction and so no icon
+PLUGIN_CATALOG_ACTIONS = ["store_view_1", "recall_view_1", "store_view_2", "recall_view_2", "store_view_3", "recall_view_3",
+                          "lock_rotation", "lock_zoom", "lock_both", "Shift", "Ctrl", "Alt", "Super", "Meta"]
+BUILD_CHUNK = 150  # Actions catalogued per event loop turn while building in the background
+
+CatalogEntry = namedtuple("CatalogEntry", ["name", "category", "text", "icon", "search"])
+
+def action_category(name):
+    lowered = name.lower()
+    for category, prefixes in ACTION_CATEGORIES.items():
+        if any(lowered.startswith(prefix.lower()) for prefix in prefixes):
+            return category
+    return "Other"
+
+class ActionCatalog(QObject):
+    """Every mappable action with its category, icon and display text, built in idle chunks after startup."""
+    ready = pyqtSignal()
+
+    def __init__(self, debug_level=lambda: 1):
+        super().__init__()
+        self.debug_level = debug_level
+        self.entries = []
+        self.by_name = {}
+        self.by_category = {category: [] for category in ACTION_CATEGORIES}
+        self.building = None  # Remaining QActions while a build is in progress
+        self.complete = False
+        self.chunk_pending = False
+        self.last_query = None
+        self.last_results = []
+        # Windows register their own actions, and scripts may add more later
+        Krita.instance().notifier().windowCreated.connect(self.rebuild)
+        QTimer.singleShot(0, self.rebuild)  # Once startup has returned to the event loop
+
+    def rebuild(self):
+        self.entries = []
+        self.by_name = {}
+        self.by_category = {category: [] for category in ACTION_CATEGORIES}
+        self.complete = False
+        self.last_query = None
+        for name in PLUGIN_CATALOG_ACTIONS:
+            self.add(name, name, QIcon())
+        self.building = iter(Krita.instance().actions())
+        self.schedule_chunk()
+
+    def add(self, name, text, icon):
+        if name in self.by_name:
+            return
+        entry = CatalogEntry(name, action_category(name), text, icon, f"{name} {text}".lower())
+        self.entries.append(entry)
+        self.by_name[name] = entry
+        self.by_category[entry.category].append(entry)
+
+    def schedule_chunk(self):
+        if not self.chunk_pending:
+            self.chunk_pending = True
+            QTimer.singleShot(0, self.build_chunk)
+
+    def build_chunk(self, limit=BUILD_CHUNK):
+        self.chunk_pending = False
+        if self.building is None:
+            return
+        count = 0
+        while not limit or count < limit:
+            action = next(self.building, None)
+            if action is None:
+                self.finish()
+                return
+            name = action.objectName()
+            if name:
+                self.add(name, action.text().replace("&", ""), action.icon())
+            count += 1
+        self.schedule_chunk()
+
+    def finish(self):
+        self.building = None
+        self.complete = True
+        debug_print("Action catalog built with %d actions", 2, debug_level=self.debug_level(), args=(len(self.entries),))
+        self.ready.emit()
+
+    def ensure(self):
+        # A menu opened before the background build finished completes it now
+        if self.complete:
+            return
+        if self.building is None:
+            self.rebuild()
+        self.build_chunk(limit=None)
+
+    def names(self):
+        self.ensure()
+        return ["None"] + [entry.name for entry in self.entries]
+
+    def contains(self, name):
+        self.ensure()
+        return name in self.by_name
+
+    def category(self, category):
+        self.ensure()
+        return self.by_category[category]
+
+    def filter(self, query):
+        self.ensure()
+        query = query.strip().lower()
+        if not query:
+            return []
+        # Typing narrows the previous results instead of rescanning the whole catalog
+        if self.last_query and query.startswith(self.last_query):
+            candidates = self.last_results
+        else:
+            candidates = self.entries
+        self.last_query = query
+        self.last_results = [entry for entry in candidates if query in entry.search]
+        return self.last_results
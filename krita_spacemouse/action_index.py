@@ -0,0 +1,73 @@
+# action_index.py
+from PyQt5.QtCore import QTimer
+from krita import Krita
+from .utils import debug_print
+try:
+    from PyQt5 import sip
+except ImportError:
+    import sip
+
+# Names the plugin handles itself instead of triggering a Krita QAction
+PLUGIN_ACTIONS = {"None", "Shift", "Ctrl", "Alt", "Super", "Meta", "previous_preset", "lock_rotation", "lock_zoom", "lock_both"}
+PLUGIN_ACTION_PREFIXES = ("BrushPreset:", "store_view_", "recall_view_")
+
+def is_plugin_action(name):
+    return name in PLUGIN_ACTIONS or name.startswith(PLUGIN_ACTION_PREFIXES)
+
+class ActionIndex:
+    """Maps every mapped action name to its Krita QAction, resolved once per mapping change."""
+
+    def __init__(self, mapped_names, debug_level=lambda: 1):
+        self.mapped_names = mapped_names  # Callable returning the action names currently mapped
+        self.debug_level = debug_level
+        self.actions = {}
+        self.unknown = set()
+        self.dirty = True
+        self.rebuild_pending = False
+        # Window actions only exist once their window does
+        Krita.instance().notifier().windowCreated.connect(self.invalidate)
+
+    def invalidate(self):
+        # Rebuild once control returns to the event loop, so a burst of mapping edits costs one walk
+        self.dirty = True
+        if not self.rebuild_pending:
+            self.rebuild_pending = True
+            QTimer.singleShot(0, self.ensure)
+
+    def ensure(self):
+        self.rebuild_pending = False
+        if not self.dirty:
+            return
+        self.dirty = False
+        app = Krita.instance()
+        actions = {}
+        unknown = set()
+        for name in self.mapped_names():
+            if name in actions or is_plugin_action(name):
+                continue
+            action = app.action(name)
+            actions[name] = action
+            if action is None:
+                unknown.add(name)
+        # Report each unknown name once, when the mapping that introduced it loads
+        for name in sorted(unknown - self.unknown):
+            debug_print(f"Mapped action '{name}' does not exist in Krita", 1, debug_level=self.debug_level())
+        self.actions = actions
+        self.unknown = unknown
+        debug_print("Action index resolved %d actions (%d unknown)", 2, debug_level=self.debug_level(), args=(len(actions), len(unknown)))
+
+    def get(self, name):
+        if self.dirty:
+            self.ensure()
+        action = self.actions.get(name)
+        if action is not None and not sip.isdeleted(action):
+            return action
+        if name in self.unknown:
+            return None  # Already reported; not looked up again until the mappings change
+        # Not mapped when the index was built, or its QAction was deleted (e.g. its window closed)
+        action = Krita.instance().action(name)
+        self.actions[name] = action
+        if action is None:
+            self.unknown.add(name)
+            debug_print(f"Action '{name}' does not exist in Krita", 1, debug_level=self.debug_level())
+        return action
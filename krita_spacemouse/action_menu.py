@@ -0,0 +1,72 @@
+# krita_spacemouse/action_menu.py
+from PyQt5.QtWidgets import QMenu, QLineEdit, QWidgetAction, QAction
+from PyQt5.QtCore import pyqtSignal
+from .action_catalog import ACTION_CATEGORIES
+
+MENU_STYLE = "QMenu { menu-scrollable: 1; }"
+MAX_FILTER_RESULTS = 40
+
+class ActionMenu(QMenu):
+    """Action chooser over the shared ActionCatalog: a type-to-filter box above lazily filled category submenus."""
+    action_selected = pyqtSignal(str)
+
+    def __init__(self, catalog, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.setStyleSheet(MENU_STYLE)
+        self.result_actions = []
+
+        self.search = QLineEdit(self)
+        self.search.setPlaceholderText("Type to filter actions...")
+        self.search.setClearButtonEnabled(True)
+        self.search.textChanged.connect(self.update_filter)
+        search_action = QWidgetAction(self)
+        search_action.setDefaultWidget(self.search)
+        self.addAction(search_action)
+
+        self.addAction("None").triggered.connect(lambda checked: self.action_selected.emit("None"))
+        self.results_separator = self.addSeparator()
+        self.results_end = self.addSeparator()
+        self.category_menus = []
+        for category in ACTION_CATEGORIES:
+            submenu = self.addMenu(category)
+            submenu.setStyleSheet(MENU_STYLE)
+            # Filled on first open, so building the menu never walks the whole catalog
+            submenu.aboutToShow.connect(lambda menu=submenu, cat=category: self.fill_category(menu, cat))
+            self.category_menus.append(submenu)
+        self.aboutToShow.connect(self.reset_filter)
+
+    def add_entry(self, menu, entry, before=None):
+        action = QAction(entry.icon, entry.name, menu)
+        if before is None:
+            menu.addAction(action)
+        else:
+            menu.insertAction(before, action)
+        if entry.text and entry.text != entry.name:
+            action.setToolTip(entry.text)
+        action.triggered.connect(lambda checked, name=entry.name: self.action_selected.emit(name))
+        return action
+
+    def fill_category(self, menu, category):
+        if menu.actions():
+            return
+        menu.setToolTipsVisible(True)
+        for entry in self.catalog.category(category):
+            self.add_entry(menu, entry)
+
+    def reset_filter(self):
+        self.search.clear()
+        self.search.setFocus()
+
+    def update_filter(self, text):
+        for action in self.result_actions:
+            self.removeAction(action)
+            action.deleteLater()
+        self.result_actions = []
+        results = self.catalog.filter(text)
+        for entry in results[:MAX_FILTER_RESULTS]:
+            self.result_actions.append(self.add_entry(self, entry, before=self.results_end))
+        # Results replace the category tree while a filter is active
+        for submenu in self.category_menus:
+            submenu.menuAction().setVisible(not text.strip())
+        self.setToolTipsVisible(bool(results))
@@ -0,0 +1,84 @@
+# krita_spacemouse/axis_meter.py
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+from PyQt5.QtCore import Qt, QRectF, QSize
+from PyQt5.QtGui import QPainter, QColor, QFont
+from .settings import MAX_INPUT
+
+METER_AXES = ["X", "Y", "Z", "RX", "RY", "RZ"]
+AXIS_COLORS = {"X": "red", "Y": "green", "Z": "blue", "RX": "yellow", "RY": "purple", "RZ": "orange"}
+DOMINANT_THRESHOLD = 100  # Same threshold the old background highlight used
+ROW_HEIGHT = 18
+LABEL_WIDTH = 32
+
+class AxisMeter(QWidget):
+    """Signed bar per puck axis with dead-zone markers, repainted only when the values change."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.values = (0,) * len(METER_AXES)
+        self.dead_zones = {}  # axis -> dead zone of its current mapping; unmapped axes have none
+        self.dominant = None
+        self.colors = {axis: QColor(color) for axis, color in AXIS_COLORS.items()}
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.setMinimumHeight(ROW_HEIGHT * len(METER_AXES) + 4)
+        self.setToolTip("Live puck input; shaded bands mark each mapped axis's dead zone")
+
+    def sizeHint(self):
+        return QSize(300, ROW_HEIGHT * len(METER_AXES) + 4)
+
+    def set_values(self, values):
+        # Called from the motion pipeline with one coalesced (x, y, z, rx, ry, rz) sample per tick
+        values = tuple(values[:len(METER_AXES)])
+        if values == self.values:
+            return
+        self.values = values
+        magnitudes = [abs(value) for value in values]
+        peak = max(magnitudes)
+        self.dominant = METER_AXES[magnitudes.index(peak)] if peak > DOMINANT_THRESHOLD else None
+        self.update()  # Qt folds several updates before the next paint into one repaint
+
+    def set_dead_zones(self, dead_zones):
+        if dead_zones != self.dead_zones:
+            self.dead_zones = dict(dead_zones)
+            self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        track_left = LABEL_WIDTH
+        track_width = max(1, self.width() - LABEL_WIDTH - 2)
+        center = track_left + track_width / 2
+        scale = track_width / (2.0 * MAX_INPUT)
+        normal_font = painter.font()
+        bold_font = QFont(normal_font)
+        bold_font.setBold(True)
+        palette = self.palette()
+
+        for row, (axis, value) in enumerate(zip(METER_AXES, self.values)):
+            top = 2 + row * ROW_HEIGHT
+            track = QRectF(track_left, top + 2, track_width, ROW_HEIGHT - 4)
+            dominant = axis == self.dominant
+
+            painter.setFont(bold_font if dominant else normal_font)
+            painter.setPen(palette.color(palette.WindowText))
+            painter.drawText(QRectF(0, top, LABEL_WIDTH - 4, ROW_HEIGHT), Qt.AlignRight | Qt.AlignVCenter, axis)
+            painter.fillRect(track, palette.color(palette.Base))
+
+            dead_zone = self.dead_zones.get(axis)
+            if dead_zone:
+                band = min(dead_zone, MAX_INPUT) * scale
+                painter.fillRect(QRectF(center - band, track.top(), 2 * band, track.height()), QColor(128, 128, 128, 70))
+
+            clamped = max(-MAX_INPUT, min(MAX_INPUT, value))
+            if clamped:
+                color = QColor(self.colors[axis])
+                if dead_zone and abs(value) <= dead_zone:
+                    color = QColor(150, 150, 150)  # Inside the dead zone: would not move anything
+                elif not dominant:
+                    color.setAlpha(90)
+                width = clamped * scale
+                painter.fillRect(QRectF(min(center, center + width), track.top() + 2, abs(width), track.height() - 4), color)
+
+            painter.setPen(palette.color(palette.Mid))
+            painter.drawLine(int(center), int(track.top()), int(center), int(track.bottom()))
+        painter.end()
@@ -0,0 +1,2 @@
+# bench/__init__.py
+# Headless benchmark for the input pipeline: python -m krita_spacemouse.bench --help
@@ -0,0 +1,22 @@
+# bench/__main__.py
+import argparse
+import json
+from .harness import SCENARIOS, BACKENDS, run_benchmark, format_report
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m krita_spacemouse.bench", description="Benchmark poll_spacenav against a fake libspnav and a stub krita module")
+    parser.add_argument("--scenario", choices=SCENARIOS, default="combined")
+    parser.add_argument("--backend", choices=BACKENDS, default="libspnav", help="Fake libspnav, or the socket backend against a local fake spacenavd")
+    parser.add_argument("--ticks", type=int, default=2000, help="Number of poll_spacenav calls")
+    parser.add_argument("--events-per-tick", type=int, default=4, help="Motion packets queued before each poll")
+    parser.add_argument("--debug-level", type=int, default=0, help="Plugin debug level while benchmarking")
+    parser.add_argument("--replay", metavar="TRACE", help="Replay a recorded trace as fast as possible instead of a scenario")
+    parser.add_argument("--record", metavar="TRACE", help="Record the events the scenario feeds through poll_spacenav")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.scenario, args.ticks, args.events_per_tick, args.debug_level, args.backend, args.replay, args.record)
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+if __name__ == "__main__":
+    main()
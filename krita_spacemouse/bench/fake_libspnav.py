@@ -0,0 +1,91 @@
+# bench/fake_libspnav.py
+# A ctypes-compatible stand-in for libspnav.so.0 that replays scripted events instead of talking to spacenavd.
+import ctypes
+import sys
+from collections import Counter, deque
+
+SPNAV_EVENT_ANY = 0
+SPNAV_EVENT_MOTION = 1
+SPNAV_EVENT_BUTTON = 2
+
+class FakeFunction:
+    # Accepts the argtypes/restype assignments spnav.py makes on real CDLL functions
+    def __init__(self, name, impl, calls):
+        self.name = name
+        self.impl = impl
+        self.calls = calls
+        self.argtypes = None
+        self.restype = None
+
+    def __call__(self, *args):
+        self.calls[self.name] += 1
+        return self.impl(*args)
+
+class FakeLibspnav:
+    """Scripted events: ("motion", x, y, z, rx, ry, rz, period) or ("button", bnum, press)."""
+
+    def __init__(self):
+        self.queue = deque()
+        self.calls = Counter()
+        self.is_open = False
+        for name in ["spnav_open", "spnav_close", "spnav_fd", "spnav_poll_event", "spnav_remove_events"]:
+            setattr(self, name, FakeFunction(name, getattr(self, "_" + name), self.calls))
+
+    def push(self, events):
+        self.queue.extend(events)
+
+    def _spnav_open(self):
+        self.is_open = True
+        return 0
+
+    def _spnav_close(self):
+        self.is_open = False
+        return 0
+
+    def _spnav_fd(self):
+        return -1  # No real socket; the extension falls back to timer polling
+
+    def _spnav_poll_event(self, event_ref):
+        if not self.queue:
+            return 0
+        event = event_ref._obj if hasattr(event_ref, "_obj") else event_ref
+        scripted = self.queue.popleft()
+        if scripted[0] == "motion":
+            motion = event.event.motion
+            event.type = SPNAV_EVENT_MOTION
+            motion.x, motion.y, motion.z, motion.rx, motion.ry, motion.rz, motion.period = scripted[1:8]
+        else:
+            button = event.event.button
+            event.type = SPNAV_EVENT_BUTTON
+            button.bnum, button.press = scripted[1], int(scripted[2])
+        return event.type
+
+    def _spnav_remove_events(self, event_type):
+        if event_type == SPNAV_EVENT_ANY:
+            removed = len(self.queue)
+            self.queue.clear()
+            return removed
+        kind = "motion" if event_type == SPNAV_EVENT_MOTION else "button"
+        kept = deque(e for e in self.queue if e[0] != kind)
+        removed = len(self.queue) - len(kept)
+        self.queue = kept
+        return removed
+
+def install(fake):
+    # Load krita_spacemouse.spnav with `fake` in place of the shared library
+    if "krita_spacemouse.spnav" in sys.modules and sys.modules["krita_spacemouse.spnav"]._libspnav_loaded:
+        raise RuntimeError("krita_spacemouse.spnav was imported before the fake libspnav was installed")
+    original_cdll = ctypes.CDLL
+
+    def cdll(name, *args, **kwargs):
+        if name == "libspnav.so.0":
+            return fake
+        return original_cdll(name, *args, **kwargs)
+
+    ctypes.CDLL = cdll
+    try:
+        from .. import spnav
+        spnav.load_libspnav()  # The library is loaded on first use, so load it while the fake is in place
+    finally:
+        ctypes.CDLL = original_cdll
+    return spnav
@@ -0,0 +1,80 @@
+# bench/fake_spnavd.py
+# A local stand-in for spacenavd that speaks the legacy socket protocol, for the socket backend.
+# Run it directly to feed a slow pan to a real Krita session: python -m krita_spacemouse.bench.fake_spnavd --socket /tmp/fake-spnav.sock
+import argparse
+import math
+import os
+import socket
+import tempfile
+import time
+from ..spnav_socket import PACKET
+
+class FakeSpnavd:
+    """Scripted events: ("motion", x, y, z, rx, ry, rz, period) or ("button", bnum, press)."""
+
+    def __init__(self, path=None):
+        self.directory = None
+        if path is None:
+            self.directory = tempfile.mkdtemp(prefix="fake-spnavd-")
+            path = os.path.join(self.directory, "spnav.sock")
+        self.path = path
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server.bind(path)
+        self.server.listen(1)
+        self.client = None
+
+    def accept(self):
+        # Call after the backend's spnav_open; connect() completes against the listen backlog
+        self.client, _ = self.server.accept()
+        return self.client
+
+    def encode(self, events):
+        packets = bytearray()
+        for event in events:
+            if event[0] == "motion":
+                packets += PACKET.pack(0, *event[1:8])
+            else:
+                packets += PACKET.pack(1 if event[2] else 2, event[1], 0, 0, 0, 0, 0, 0)
+        return bytes(packets)
+
+    def push(self, events):
+        self.client.sendall(self.encode(events))
+
+    def close(self):
+        for sock in (self.client, self.server):
+            if sock:
+                sock.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        if self.directory:
+            os.rmdir(self.directory)
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m krita_spacemouse.bench.fake_spnavd", description="Serve a scripted SpaceMouse stream over the spacenavd socket protocol")
+    parser.add_argument("--socket", default=os.path.join(tempfile.gettempdir(), "fake-spnav.sock"), help="Socket path; point SPNAV_SOCKPATH at it")
+    parser.add_argument("--rate", type=int, default=125, help="Motion packets per second")
+    args = parser.parse_args()
+
+    daemon = FakeSpnavd(args.socket)
+    print(f"Listening on {daemon.path}")
+    try:
+        while True:
+            daemon.accept()
+            print("Client connected")
+            period = 1000 // args.rate
+            tick = 0
+            try:
+                while True:
+                    swing = math.sin(tick * 2 * math.pi / args.rate)
+                    daemon.push([("motion", 0, 0, 0, int(300 * swing), 0, int(-300 * swing), period)])
+                    tick += 1
+                    time.sleep(period / 1000.0)
+            except (BrokenPipeError, ConnectionResetError):
+                print("Client disconnected")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.close()
+
+if __name__ == "__main__":
+    main()
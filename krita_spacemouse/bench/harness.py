@@ -0,0 +1,183 @@
+# bench/harness.py
+import math
+import os
+import sys
+import time
+from . import stub_krita
+from .fake_libspnav import FakeLibspnav, install as install_fake_libspnav
+
+SCENARIOS = ("idle", "pan", "combined", "buttons", "mixed")
+BACKENDS = ("libspnav", "socket")
+
+class BenchDocker:
+    # The parts of SpacenavDocker the input pipeline reads
+    def __init__(self, settings_manager_cls, debug_level):
+        self.debug_level_value = debug_level
+        self.long_press_duration = 500
+        self.global_dead_zone = 130
+        self.global_sensitivity = 100
+        self.settings = settings_manager_cls(self, load=False)
+        self.settings.button_mappings = self.settings.button_presets["Default"].copy()
+
+    def objectName(self):
+        return "spacenavDocker"
+
+class BenchExtension:
+    # Mirrors the pipeline state SpacenavControlExtension sets up, without the docker/UI imports
+    def __init__(self, docker, spnav_module, backend):
+        from ..motion_coalescer import MotionCoalescer
+        from ..integrator import MotionIntegrator
+        from ..view_context import ViewContext
+        from ..transform import TransformAccumulator
+        from ..button_dispatcher import ButtonDispatcher
+        self.docker = docker
+        self.debug_level_value = docker.debug_level_value
+        self.spnav = backend
+        self.event = spnav_module.SpnavEventWrapper()
+        self.notifier = None
+        self.reader = None
+        self.scheduler = None  # The benchmark drives poll_spacenav directly
+        self.recorder = None
+        self.connected = True
+        self.last_motion_time = 0
+        self.last_motion_data = {"x": 0, "y": 0, "z": 0, "rx": 0, "ry": 0, "rz": 0}
+        self.motion_listeners = []  # Called with each coalesced motion sample, e.g. the puck dialog's axis meter
+        self.last_logged_motion = None
+        self.button_states = {}
+        self.modifier_states = {"Shift": False, "Ctrl": False, "Alt": False}
+        self.view_states = {"V1": None, "V2": None, "V3": None}
+        self.lock_rotation = False
+        self.lock_zoom = False
+        self.zoom_anchor = "center"
+        self.integrator = MotionIntegrator()
+        self.coalescer = MotionCoalescer("mean")
+        self.view_context = ViewContext(self)
+        self.transform = TransformAccumulator(self)
+        self.button_dispatcher = ButtonDispatcher(self)
+
+    def stop_input(self):
+        self.connected = False
+
+def scenario_ticks(name, ticks, events_per_tick):
+    # Yields the list of scripted events delivered before each poll
+    for tick in range(ticks):
+        phase = tick * 2 * math.pi / 120
+        events = []
+        if name in ("pan", "combined", "mixed"):
+            for i in range(events_per_tick):
+                swing = math.sin(phase + i * 0.01)
+                if name == "pan":
+                    events.append(("motion", 0, 0, 0, int(350 * swing), 0, int(-350 * swing), 8))
+                else:
+                    events.append(("motion", 0, int(300 * swing), 0, int(350 * swing), int(250 * swing), int(-350 * swing), 8))
+        if name == "buttons" or (name == "mixed" and tick % 10 == 0):
+            button = (0, 1, 8, 27, 28)[tick % 5]
+            events.append(("button", button, True))
+            events.append(("button", button, False))
+        yield events
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+def replay_ticks(replay):
+    # One recorded drain per poll until the trace runs out
+    while not replay.finished:
+        yield ()
+
+def run_benchmark(scenario="combined", ticks=2000, events_per_tick=4, debug_level=0, backend="libspnav", replay=None, record=None):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    stub_krita.install()
+    fake = FakeLibspnav()
+    spnav = install_fake_libspnav(fake)
+    from ..settings import SettingsManager
+    from ..event_handler import poll_spacenav
+
+    daemon = None
+    if replay:
+        from ..recorder import SpnavReplay, RECORD
+        spnav_backend = SpnavReplay(replay, realtime=False)
+        if spnav_backend.spnav_open() == -1:
+            raise SystemExit(f"Not a SpaceMouse trace: {replay}")
+        feed = None
+        scenario, backend = "replay", "replay"
+    elif backend == "socket":
+        from ..spnav_socket import SpnavSocket
+        from .fake_spnavd import FakeSpnavd
+        daemon = FakeSpnavd()
+        spnav_backend = SpnavSocket(daemon.path)
+        spnav_backend.spnav_open()
+        daemon.accept()
+        feed = daemon.push
+    else:
+        spnav_backend = spnav.libspnav
+        feed = fake.push
+
+    docker = BenchDocker(SettingsManager, debug_level)
+    extension = BenchExtension(docker, spnav, spnav_backend)
+    poll_spacenav(extension)  # Warm up: resolve the view context and compile the dispatch table
+    if replay:
+        spnav_backend.position = 0  # Measure the whole trace, including what the warm-up poll consumed
+    if record:
+        from ..recorder import EventRecorder
+        extension.recorder = EventRecorder(record)
+    stub_krita.calls.clear()
+    fake.calls.clear()
+
+    tick_ns = []
+    event_tick_ns = []
+    total_events = 0
+    polls = 0
+    for events in (replay_ticks(spnav_backend) if replay else scenario_ticks(scenario, ticks, events_per_tick)):
+        if feed:
+            feed(events)
+        position = getattr(spnav_backend, "position", 0)
+        start = time.perf_counter_ns()
+        poll_spacenav(extension)
+        elapsed = time.perf_counter_ns() - start
+        if replay:
+            events = range((spnav_backend.position - position) // RECORD.size)
+        tick_ns.append(elapsed)
+        # Tick time counted once per event it processed; this is not injection-to-canvas latency
+        event_tick_ns.extend([elapsed] * len(events))
+        total_events += len(events)
+        polls += 1
+    app.processEvents()
+    if extension.recorder:
+        extension.recorder.close()
+    if replay:
+        spnav_backend.spnav_close()
+    if daemon:
+        spnav_backend.spnav_close()
+        daemon.close()
+
+    total_ns = sum(tick_ns)
+    return {
+        "scenario": scenario,
+        "backend": backend,
+        "ticks": polls,
+        "events": total_events,
+        "events_per_sec": total_events / (total_ns / 1e9) if total_ns else 0.0,
+        "tick_us": {p: percentile(tick_ns, p / 100) / 1000 for p in (50, 90, 99)},
+        "event_tick_us": {p: percentile(event_tick_ns, p / 100) / 1000 for p in (50, 90, 99)},
+        "krita_calls": dict(stub_krita.calls),
+        "libspnav_calls": dict(fake.calls),
+    }
+
+def format_report(report):
+    lines = [
+        f"Scenario: {report['scenario']} via {report['backend']} ({report['ticks']} ticks, {report['events']} events)",
+        f"Throughput: {report['events_per_sec']:.0f} events/sec",
+        "Tick time (us): " + ", ".join(f"p{p}={v:.1f}" for p, v in report["tick_us"].items()),
+        "Tick time per event (us): " + ", ".join(f"p{p}={v:.1f}" for p, v in report["event_tick_us"].items()),
+        "Krita API calls:",
+    ]
+    lines += [f"  {name}: {count}" for name, count in sorted(report["krita_calls"].items())]
+    lines.append("libspnav calls:")
+    lines += [f"  {name}: {count}" for name, count in sorted(report["libspnav_calls"].items())]
+    return "\n".join(lines)
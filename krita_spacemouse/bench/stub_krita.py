@@ -0,0 +1,265 @@
+# bench/stub_krita.py
+# Stand-ins for the krita module (and pyautogui) so the input pipeline can run headless.
+# Every call into the fake Krita API is counted in `calls`.
+import sys
+import types
+from collections import Counter
+from PyQt5.QtCore import QObject, QPoint, QRect, Qt
+
+calls = Counter()
+# Every view change schedules a canvas repaint unless the viewport has updates disabled
+viewport_state = {"updates_enabled": True}
+
+def schedule_repaint():
+    if viewport_state["updates_enabled"]:
+        calls["canvas.repaint"] += 1
+
+class StubSignal:
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+    def disconnect(self, slot=None):
+        if slot is None:
+            self.slots.clear()
+        elif slot in self.slots:
+            self.slots.remove(slot)
+        else:
+            raise TypeError("slot not connected")
+
+    def emit(self, *args):
+        for slot in list(self.slots):
+            slot(*args)
+
+class StubScrollBar:
+    def __init__(self, orientation):
+        self._orientation = orientation
+        self._value = 0
+
+    def orientation(self):
+        return self._orientation
+
+    def value(self):
+        calls["scrollbar.value"] += 1
+        return self._value
+
+    def setValue(self, value):
+        calls["scrollbar.setValue"] += 1
+        self._value = int(value)
+        schedule_repaint()
+
+class StubViewport:
+    def rect(self):
+        return QRect(0, 0, 1600, 1000)
+
+    def mapFromGlobal(self, point):
+        return QPoint(800, 500)
+
+    def setUpdatesEnabled(self, enabled):
+        calls["viewport.setUpdatesEnabled"] += 1
+        viewport_state["updates_enabled"] = enabled
+
+    def update(self):
+        calls["viewport.update"] += 1
+        schedule_repaint()
+
+class StubScrollArea:
+    def __init__(self):
+        self.hscroll = StubScrollBar(Qt.Horizontal)
+        self.vscroll = StubScrollBar(Qt.Vertical)
+        self._viewport = StubViewport()
+
+    def horizontalScrollBar(self):
+        return self.hscroll
+
+    def verticalScrollBar(self):
+        return self.vscroll
+
+    def viewport(self):
+        return self._viewport
+
+class StubViewWidget:
+    def __init__(self):
+        self.scroll_area = StubScrollArea()
+
+    def findChild(self, kind, name=""):
+        calls["findChild"] += 1
+        return self.scroll_area
+
+class StubSubWindow:
+    def __init__(self):
+        self._widget = StubViewWidget()
+
+    def widget(self):
+        return self._widget
+
+    def findChildren(self, kind, name=""):
+        calls["findChildren"] += 1
+        return [self._widget.scroll_area.hscroll, self._widget.scroll_area.vscroll]
+
+class StubMdiArea:
+    def __init__(self):
+        self.subwindow = StubSubWindow()
+        self.subWindowActivated = StubSignal()
+
+    def currentSubWindow(self):
+        calls["mdi.currentSubWindow"] += 1
+        return self.subwindow
+
+class StubQWindow:
+    def __init__(self):
+        self.mdi_area = StubMdiArea()
+
+    def findChild(self, kind, name=""):
+        calls["findChild"] += 1
+        return self.mdi_area
+
+class StubCanvas:
+    def __init__(self):
+        self._zoom = 1.0
+        self._rotation = 0.0
+
+    def zoomLevel(self):
+        calls["canvas.zoomLevel"] += 1
+        return self._zoom * (300 / 72.0)
+
+    def setZoomLevel(self, value):
+        calls["canvas.setZoomLevel"] += 1
+        self._zoom = value
+        schedule_repaint()
+
+    def rotation(self):
+        calls["canvas.rotation"] += 1
+        return self._rotation
+
+    def setRotation(self, value):
+        calls["canvas.setRotation"] += 1
+        self._rotation = value
+        schedule_repaint()
+
+class StubDocument:
+    def resolution(self):
+        calls["document.resolution"] += 1
+        return 300
+
+class StubView:
+    def __init__(self):
+        self._canvas = StubCanvas()
+        self._document = StubDocument()
+
+    def canvas(self):
+        calls["view.canvas"] += 1
+        return self._canvas
+
+    def document(self):
+        calls["view.document"] += 1
+        return self._document
+
+    def setCurrentBrushPreset(self, preset):
+        calls["view.setCurrentBrushPreset"] += 1
+
+class StubWindow:
+    def __init__(self):
+        self.view = StubView()
+        self._qwindow = StubQWindow()
+        self.activeViewChanged = StubSignal()
+        self.windowClosed = StubSignal()
+
+    def activeView(self):
+        calls["window.activeView"] += 1
+        return self.view
+
+    def qwindow(self):
+        calls["window.qwindow"] += 1
+        return self._qwindow
+
+class StubAction(QObject):
+    # A real QObject so the plugin's sip.isdeleted() checks work on it
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+        self.setObjectName(name)
+
+    def trigger(self):
+        calls["action.trigger"] += 1
+        calls[f"action.trigger:{self.name}"] += 1
+
+class StubResource:
+    def __init__(self, name):
+        self._name = name
+
+    def name(self):
+        return self._name
+
+class StubNotifier:
+    def __init__(self):
+        for name in ["applicationClosing", "viewClosed", "viewCreated", "windowCreated", "imageCreated", "imageClosed", "configurationChanged"]:
+            setattr(self, name, StubSignal())
+
+class Krita:
+    _instance = None
+
+    def __init__(self):
+        self.window = StubWindow()
+        self._notifier = StubNotifier()
+        self._actions = {}
+        self._presets = {f"Preset {i}": StubResource(f"Preset {i}") for i in range(200)}
+
+    @classmethod
+    def instance(cls):
+        calls["Krita.instance"] += 1
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def activeWindow(self):
+        calls["Krita.activeWindow"] += 1
+        return self.window
+
+    def notifier(self):
+        return self._notifier
+
+    def action(self, name):
+        calls["Krita.action"] += 1
+        if name not in self._actions:
+            self._actions[name] = StubAction(name)
+        return self._actions[name]
+
+    def documents(self):
+        return [self.window.view.document()]
+
+    def actions(self):
+        calls["Krita.actions"] += 1
+        return list(self._actions.values())
+
+    def resources(self, kind):
+        calls["Krita.resources"] += 1
+        return dict(self._presets)
+
+    def getAppDataLocation(self):
+        return ""  # Nothing for the preset cache to watch
+
+    def dockers(self):
+        calls["Krita.dockers"] += 1
+        return []
+
+class Extension:
+    def __init__(self, parent=None):
+        self.parent = parent
+
+def install():
+    # Must run before any krita_spacemouse module that imports krita or pyautogui is loaded
+    krita = types.ModuleType("krita")
+    krita.Krita = Krita
+    krita.Extension = Extension
+    krita.DockWidgetFactory = object
+    krita.DockWidgetFactoryBase = types.SimpleNamespace(DockRight=2)
+    sys.modules["krita"] = krita
+    # Always stubbed: the real module would send modifier key presses to the desktop while benchmarking
+    pyautogui = types.ModuleType("pyautogui")
+    pyautogui.keyDown = lambda key: calls.update(["pyautogui.keyDown"])
+    pyautogui.keyUp = lambda key: calls.update(["pyautogui.keyUp"])
+    sys.modules["pyautogui"] = pyautogui
+    return krita
@@ -1,54 +1,112 @@
 # krita_spacemouse/brush_popup.py
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QScrollArea, QGridLayout, QPushButton
-from PyQt5.QtCore import Qt, QSize
-from PyQt5.QtGui import QIcon, QPixmap, QColor, QPainter
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QListView
+from PyQt5.QtCore import Qt, QSize, QAbstractListModel, QModelIndex
+from PyQt5.QtGui import QPixmap, QColor, QPainter
+from .thumbnail_cache import ThumbnailCache, THUMB_SIZE, resource_key
 from .utils import debug_print
 
+TILE_SIZE = QSize(310, THUMB_SIZE + 8)
+
+def placeholder_pixmap():
+    pixmap = QPixmap(THUMB_SIZE, THUMB_SIZE)
+    pixmap.fill(QColor(200, 200, 200))
+    painter = QPainter(pixmap)
+    painter.drawText(5, 32, "No Img")
+    painter.end()
+    return pixmap
+
+class PresetListModel(QAbstractListModel):
+    """Preset names with thumbnails that are only loaded once the view asks for them."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.presets = {}
+        self.names = []
+        self.keys = {}  # name -> resource key, resolved on first display
+        self.rows = {}  # resource key -> rows showing it
+        self.pixmaps = {}  # resource key -> QPixmap
+        self.placeholder = placeholder_pixmap()
+        self.thumbnails = ThumbnailCache()
+        self.thumbnails.ready.connect(self.thumbnail_ready)
+
+    def set_presets(self, presets):
+        if presets is self.presets:
+            return  # The preset cache hands out the same dict until it rebuilds
+        self.beginResetModel()
+        self.presets = presets
+        self.names = list(presets.keys())
+        self.keys = {}
+        self.rows = {}
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.names)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        name = self.names[index.row()]
+        if role == Qt.DisplayRole:
+            return name.strip()
+        if role == Qt.DecorationRole:
+            return self.thumbnail(index.row(), name)
+        if role == Qt.UserRole:
+            return name
+        return None
+
+    def thumbnail(self, row, name):
+        key = self.keys.get(name)
+        if key is None:
+            key = self.keys[name] = resource_key(self.presets[name])
+            self.rows.setdefault(key, []).append(row)
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            return pixmap
+        if self.thumbnails.is_cached(key):
+            self.thumbnails.request(key)
+        else:
+            # Resource objects belong to the GUI thread, so only the scaling is handed off
+            self.thumbnails.request(key, self.presets[name].image())
+        return self.placeholder
+
+    def thumbnail_ready(self, key, image):
+        self.pixmaps[key] = QPixmap.fromImage(image) if not image.isNull() else self.placeholder
+        for row in self.rows.get(key, ()):
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
 class BrushPresetPopup(QWidget):
-    def __init__(self, parent, resources, settings, button_id):
+    def __init__(self, parent, settings):
         super().__init__(parent)
         self.setWindowFlags(Qt.Popup)
-        self.resources = resources
         self.settings = settings
-        self.button_id = button_id
+        self.button_id = None
         self.layout = QVBoxLayout(self)
 
-        scroll = QScrollArea(self)
-        scroll.setWidgetResizable(True)
-        scroll.setFixedHeight(400)
-        scroll.setFixedWidth(1000)
-        self.layout.addWidget(scroll)
-
-        grid_widget = QWidget()
-        self.grid = QGridLayout(grid_widget)
-        scroll.setWidget(grid_widget)
-        self.populate_grid()
-
-    def populate_grid(self):
-        row = 0
-        col = 0
-        for preset_name, preset in self.resources.items():
-            preset_name_clean = preset_name.strip()
-            pixmap = QPixmap.fromImage(preset.image()) if preset.image() and not preset.image().isNull() else QPixmap(64, 64)
-            if pixmap.isNull():
-                pixmap.fill(QColor(200, 200, 200))
-                painter = QPainter(pixmap)
-                painter.drawText(5, 32, "No Img")
-                painter.end()
-            btn = QPushButton(self)
-            btn.setFixedWidth(310)
-            btn.setIcon(QIcon(pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)))
-            btn.setIconSize(QSize(64, 64))
-            btn.setText(preset_name_clean)
-            btn.setStyleSheet("text-align: left; padding-left: 10px;")
-            btn.setLayoutDirection(Qt.LeftToRight)
-            btn.clicked.connect(lambda checked, pn=preset_name_clean: self.on_button_clicked(pn))
-            self.grid.addWidget(btn, row, col)
-            col += 1
-            if col >= 3:
-                col = 0
-                row += 1
-
-    def on_button_clicked(self, preset_name):
+        self.model = PresetListModel(self)
+        self.view = QListView(self)
+        self.view.setModel(self.model)
+        self.view.setViewMode(QListView.ListMode)
+        self.view.setFlow(QListView.LeftToRight)
+        self.view.setWrapping(True)
+        self.view.setResizeMode(QListView.Adjust)
+        self.view.setUniformItemSizes(True)  # Lets the view lay out thousands of rows without measuring each
+        self.view.setGridSize(TILE_SIZE)
+        self.view.setIconSize(QSize(THUMB_SIZE, THUMB_SIZE))
+        self.view.setFixedHeight(400)
+        self.view.setFixedWidth(1000)
+        self.view.clicked.connect(self.on_preset_clicked)
+        self.layout.addWidget(self.view)
+
+    def show_for(self, button_id, presets, pos):
+        self.button_id = button_id
+        self.model.set_presets(presets)
+        self.move(pos)
+        self.show()
+        debug_print("Brush preset popup opened for button %d with %d presets", 2, debug_level=getattr(self.parent(), 'debug_level_value', 1),
+                    args=(button_id, len(presets)))
+
+    def on_preset_clicked(self, index):
+        preset_name = index.data(Qt.UserRole).strip()
         self.settings.update_button_mapping(self.button_id, f"BrushPreset:{preset_name}")
         self.hide()
@@ -0,0 +1,132 @@
+# button_dispatcher.py
+import time
+from PyQt5.QtCore import QTimer
+from .button_handler import compile_action, run_action
+from .utils import debug_print
+
+SHORT_PRESS = "short"
+LONG_PRESS = "long"
+MODIFIER_KEYS = ("Shift", "Ctrl", "Alt", "Super", "Meta")
+
+class ButtonState:
+    __slots__ = ("pressed_ns", "long_fired")
+
+    def __init__(self, pressed_ns):
+        self.pressed_ns = pressed_ns
+        self.long_fired = False
+
+class ButtonDispatcher:
+    """Dispatches button presses through a table compiled from the mappings, with press state kept per button."""
+
+    def __init__(self, extension):
+        self.extension = extension
+        self.table = {}  # (button_id, modifier, kind) -> (handler, argument, action_name)
+        self.version = None  # settings.button_mappings_version the table was compiled from
+        self.states = {}  # button_id -> ButtonState while held
+        self.deadlines = {}  # button_id -> monotonic ns its long press fires at
+        # One timer, re-armed to the nearest deadline, serves every held button
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.fire_due)
+
+    def compile(self, mappings):
+        table = {}
+        for button, mapping in mappings.items():
+            try:
+                button_id = int(button)
+            except ValueError:
+                continue  # Puck axes share the mappings dict
+            if isinstance(mapping, str):
+                mapping = {"None": mapping}
+            default = mapping.get("None", "None")
+            long_name = mapping.get("Long", "None")
+            long_press = compile_action(long_name)
+            for modifier in ("None",) + MODIFIER_KEYS:
+                action_name = mapping.get(modifier, default)
+                short_press = compile_action(action_name)
+                if short_press:
+                    table[(button_id, modifier, SHORT_PRESS)] = short_press + (action_name,)
+                if long_press:
+                    table[(button_id, modifier, LONG_PRESS)] = long_press + (long_name,)
+        self.table = table
+
+    def ensure_table(self):
+        settings = self.extension.docker.settings
+        if self.version != settings.button_mappings_version:
+            self.compile(settings.button_mappings)
+            self.version = settings.button_mappings_version
+            debug_print("Compiled %d button handlers", 2, debug_level=self.extension.docker.debug_level_value, args=(len(self.table),))
+
+    def active_modifier(self):
+        states = self.extension.modifier_states
+        for modifier in MODIFIER_KEYS:
+            if states.get(modifier):
+                return modifier
+        return "None"
+
+    def long_press_ns(self):
+        return getattr(self.extension.docker, 'long_press_duration', 500) * 1_000_000
+
+    def has_long_press(self, button_id):
+        # Long entries are compiled for every modifier, so the unmodified key answers for all of them
+        return (button_id, "None", LONG_PRESS) in self.table
+
+    def press(self, button_id):
+        self.ensure_table()
+        now = time.monotonic_ns()
+        self.states[button_id] = ButtonState(now)
+        # Buttons without a long press only need the hold time, measured on release, so need no timer
+        if self.has_long_press(button_id):
+            self.deadlines[button_id] = now + self.long_press_ns()
+            self.arm()
+
+    def release(self, button_id):
+        state = self.states.pop(button_id, None)
+        if self.deadlines.pop(button_id, None) is not None:
+            self.arm()
+        if state is None or state.long_fired:
+            return
+        self.ensure_table()
+        held_ns = time.monotonic_ns() - state.pressed_ns
+        if held_ns >= self.long_press_ns():
+            # A long hold never fires the short action; it fires Long if the timer was late (e.g. the event loop was busy)
+            if self.has_long_press(button_id):
+                self.run(button_id, LONG_PRESS)
+            return
+        self.run(button_id, SHORT_PRESS)
+
+    def arm(self):
+        if not self.deadlines:
+            self.timer.stop()
+            return
+        remaining_ns = min(self.deadlines.values()) - time.monotonic_ns()
+        self.timer.start(max(0, -(-remaining_ns // 1_000_000)))
+
+    def fire_due(self):
+        now = time.monotonic_ns()
+        due = [button_id for button_id, deadline in self.deadlines.items() if deadline <= now]
+        for button_id in due:
+            del self.deadlines[button_id]
+            self.states[button_id].long_fired = True
+        self.arm()
+        for button_id in due:
+            self.run(button_id, LONG_PRESS)
+
+    def run(self, button_id, kind):
+        modifier = self.active_modifier()
+        entry = self.table.get((button_id, modifier, kind))
+        if entry is None:
+            return
+        handler, argument, action_name = entry
+        debug_level = self.extension.docker.debug_level_value
+        if kind == LONG_PRESS:
+            debug_print("Long press on %d: %s", 1, debug_level=debug_level, args=(button_id, action_name))
+        else:
+            debug_print("Short press mapped: %s+%s", 1, debug_level=debug_level, args=(modifier, action_name))
+        run_action(self.extension, handler, argument, debug_level)
+
+    def reset(self):
+        # Forget held buttons, e.g. when input stops mid-press
+        self.states.clear()
+        self.deadlines.clear()
+        self.timer.stop()
@@ -1,10 +1,7 @@
 # button_handler.py
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtWidgets import QMdiArea, QAbstractScrollArea, QApplication
-from krita import Krita
+from PyQt5.QtWidgets import QApplication
 from .utils import debug_print
-import time
-import pyautogui
+from .transform import batched_updates
 
 # Modifier mapping for SpaceMouse buttons
 modifier_map = {
@@ -15,160 +12,124 @@ modifier_map = {
     "Meta": None
 }
 
+# Hardware buttons that pass their modifier key through to Krita, compiled from modifier_map
+MODIFIER_BUTTONS = {button: mod for mod, button in modifier_map.items() if button is not None}
+LOCK_ACTIONS = ("lock_rotation", "lock_zoom", "lock_both")
+
 def process_button_event(self, button_id, press_state):
     docker = self.docker
-    debug_print(f"Button event - ID={button_id}, Press={press_state}", 1, debug_level=docker.debug_level_value)
-    mappings = docker.settings.button_mappings.get(str(button_id), {"None": "None"})
-    if isinstance(mappings, str):
-        mappings = {"None": mappings}
-
-    # Initialize button press tracking if not present
-    if not hasattr(self, 'button_press_times'):
-        self.button_press_times = {}
-    if not hasattr(self, 'long_press_timer'):
-        self.long_press_timer = QTimer()
-        self.long_press_timer.setSingleShot(True)
-
-    # Disconnect previous timeout signal to avoid stale button_id
-    try:
-        self.long_press_timer.timeout.disconnect()
-    except TypeError:
-        pass
-    self.long_press_timer.timeout.connect(lambda: handle_long_press(self, button_id))
+    debug_print("Button event - ID=%d, Press=%s", 1, debug_level=docker.debug_level_value, args=(button_id, press_state))
 
     # Handle modifier passthrough
-    for mod, mod_button in modifier_map.items():
-        if mod_button == button_id:
-            self.modifier_states[mod] = press_state
-            if press_state:
-                pyautogui.keyDown(mod.lower())
-                debug_print(f"{mod} modifier pressed via button {button_id}", 1, debug_level=docker.debug_level_value)
-            else:
-                pyautogui.keyUp(mod.lower())
-                debug_print(f"{mod} modifier released via button {button_id}", 1, debug_level=docker.debug_level_value)
+    mod = MODIFIER_BUTTONS.get(button_id)
+    if mod:
+        self.modifier_states[mod] = press_state
+        import pyautogui  # Slow to import, and only modifier buttons need it
+        if press_state:
+            pyautogui.keyDown(mod.lower())
+        else:
+            pyautogui.keyUp(mod.lower())
+        debug_print("%s modifier %s via button %d", 1, debug_level=docker.debug_level_value,
+                    args=(mod, "pressed" if press_state else "released", button_id))
 
-    long_press_duration = getattr(docker, 'long_press_duration', 500)
     if press_state:
-        self.button_press_times[button_id] = time.time() * 1000
-        self.long_press_timer.start(long_press_duration)
+        self.button_dispatcher.press(button_id)
     else:
-        if button_id in self.button_press_times:
-            press_duration = (time.time() * 1000) - self.button_press_times[button_id]
-            del self.button_press_times[button_id]
-            self.long_press_timer.stop()
-            if press_duration < long_press_duration:
-                handle_short_press(self, button_id, mappings)
-
-def handle_short_press(self, button_id, mappings):
-    active_modifier = "None"
-    for mod, state in self.modifier_states.items():
-        if state and mod in ["Shift", "Ctrl", "Alt", "Super", "Meta"]:
-            active_modifier = mod
-            break
-    action_name = mappings.get(active_modifier, mappings.get("None", "None"))
-    debug_print(f"Short press mapped: {active_modifier}+{action_name}", 1, debug_level=self.docker.debug_level_value)
-    execute_action(self, button_id, action_name, self.docker.debug_level_value)
-
-def handle_long_press(self, button_id):
-    mappings = self.docker.settings.button_mappings.get(str(button_id), {"None": "None"})
-    action_name = mappings.get("Long", "None")
-    if action_name != "None":
-        debug_print(f"Long press on {button_id}: {action_name}", 1, debug_level=self.docker.debug_level_value)
-        execute_action(self, button_id, action_name, self.docker.debug_level_value)
-
-def execute_action(self, button_id, action_name, debug_level):
-    if action_name in modifier_map:
-        return  # Handled in process_button_event
-
-    if action_name != "None":
-        view = Krita.instance().activeWindow().activeView()
-        if not view:
-            debug_print("No active view for button action", 1, debug_level=debug_level)
-            return
-
-        elif action_name.startswith("BrushPreset:"):
-            preset_name = action_name.split(":", 1)[1]
-            resources = Krita.instance().resources("preset")
-            preset = resources.get(preset_name, None)
-            if preset:
-                view.setCurrentBrushPreset(preset)
-                self.recent_presets.append(preset_name)
-                if len(self.recent_presets) > 2:
-                    self.recent_presets.pop(0)
-                debug_print(f"Applied brush preset: {preset_name}", 1, debug_level=debug_level)
-            else:
-                debug_print(f"Brush preset not found: {preset_name}", 1, debug_level=debug_level)
-
-        elif action_name == "previous_preset":
-            if self.recent_presets and len(self.recent_presets) > 1:
-                previous_name = self.recent_presets[-2]
-                resources = Krita.instance().resources("preset")
-                preset = resources.get(previous_name, None)
-                if preset:
-                    view.setBrushPreset(preset)
-                    debug_print(f"Reverted to previous preset: {previous_name}", 1, debug_level=debug_level)
-                else:
-                    debug_print(f"Previous preset not found: {previous_name}", 1, debug_level=debug_level)
-            else:
-                debug_print("No previous preset available", 1, debug_level=debug_level)
-
-        elif action_name.startswith("store_view_") or action_name.startswith("recall_view_"):
-            canvas = view.canvas()
-            qwin = Krita.instance().activeWindow().qwindow()
-            subwindow = qwin.findChild(QMdiArea).currentSubWindow()
-            if not subwindow:
-                debug_print("No subwindow for view action", 1, debug_level=debug_level)
-                return
-            scroll_area = subwindow.widget().findChild(QAbstractScrollArea)
-            if not scroll_area:
-                debug_print("No scroll area for view action", 1, debug_level=debug_level)
-                return
-            hscroll = scroll_area.horizontalScrollBar()
-            vscroll = scroll_area.verticalScrollBar()
-            if not (hscroll and vscroll):
-                debug_print("Scrollbars missing for view action", 1, debug_level=debug_level)
-                return
-
-            view_key = action_name.split("_")[-1]
-            ZOOM_SCALE_FACTOR = 4.17
-            if action_name.startswith("store_view_"):
-                x = hscroll.value()
-                y = vscroll.value()
-                zoom = canvas.zoomLevel()  # Store raw zoom
-                rotation = canvas.rotation()
-                self.view_states[view_key] = (x, y, zoom, rotation)
-                debug_print(f"Stored view {view_key}: x={x}, y={y}, zoom={zoom}, rotation={rotation}", 1, debug_level=debug_level)
-            elif action_name.startswith("recall_view_"):
-                if self.view_states.get(view_key):
-                    x, y, zoom, rotation = self.view_states[view_key]
-                    canvas.setZoomLevel(zoom / ZOOM_SCALE_FACTOR)  # Scale on recall
-                    QApplication.processEvents()
-                    canvas.setRotation(rotation)
-                    hscroll.setValue(x)
-                    vscroll.setValue(y)
-                    QApplication.processEvents()
-                    debug_print(f"Recalled view {view_key}: x={x}, y={y}, zoom={zoom}, rotation={rotation}", 1, debug_level=debug_level)
-                else:
-                    debug_print(f"No view stored for {view_key}", 1, debug_level=debug_level)
-
-        elif action_name in ["lock_rotation", "lock_zoom", "lock_both"]:
-            if action_name == "lock_rotation":
-                self.lock_rotation = not self.lock_rotation
-                self.lock_zoom = False
-                debug_print(f"Rotation lock {'enabled' if self.lock_rotation else 'disabled'}, Zoom lock disabled", 1, debug_level=debug_level)
-            elif action_name == "lock_zoom":
-                self.lock_zoom = not self.lock_zoom
-                self.lock_rotation = False
-                debug_print(f"Zoom lock {'enabled' if self.lock_zoom else 'disabled'}, Rotation lock disabled", 1, debug_level=debug_level)
-            elif action_name == "lock_both":
-                self.lock_rotation = not self.lock_rotation
-                self.lock_zoom = self.lock_rotation
-                debug_print(f"Rotation and Zoom lock {'enabled' if self.lock_rotation else 'disabled'}", 1, debug_level=debug_level)
-
+        self.button_dispatcher.release(button_id)
+
+def compile_action(action_name):
+    # Resolve an action name to (handler, argument) once, when the mappings are compiled
+    if action_name == "None" or action_name in modifier_map:
+        return None  # Modifiers are handled in process_button_event
+    if action_name.startswith("BrushPreset:"):
+        return apply_brush_preset, action_name.split(":", 1)[1]
+    if action_name == "previous_preset":
+        return apply_previous_preset, None
+    if action_name.startswith("store_view_"):
+        return store_view, action_name.split("_")[-1]
+    if action_name.startswith("recall_view_"):
+        return recall_view, action_name.split("_")[-1]
+    if action_name in LOCK_ACTIONS:
+        return toggle_lock, action_name
+    return trigger_action, action_name
+
+def run_action(self, handler, argument, debug_level):
+    context = self.view_context
+    if not context.resolve():
+        debug_print("No active view for button action", 1, debug_level=debug_level)
+        return
+    handler(self, context, argument, debug_level)
+
+def apply_brush_preset(self, context, preset_name, debug_level):
+    preset = self.docker.settings.preset_cache.get(preset_name)
+    if preset:
+        context.view.setCurrentBrushPreset(preset)
+        self.docker.settings.preset_cache.touch(preset_name)
+        debug_print(f"Applied brush preset: {preset_name}", 1, debug_level=debug_level)
+    else:
+        debug_print(f"Brush preset not found: {preset_name}", 1, debug_level=debug_level)
+
+def apply_previous_preset(self, context, _, debug_level):
+    preset_cache = self.docker.settings.preset_cache
+    previous_name = preset_cache.previous()
+    if previous_name:
+        preset = preset_cache.get(previous_name)
+        if preset:
+            context.view.setCurrentBrushPreset(preset)
+            preset_cache.touch(previous_name)  # Pressing again swaps back
+            debug_print(f"Reverted to previous preset: {previous_name}", 1, debug_level=debug_level)
         else:
-            action = Krita.instance().action(action_name)
-            if action:
-                action.trigger()
-                debug_print(f"Triggered action: {action_name}", 4, debug_level=debug_level)
-            else:
-                debug_print(f"Action {action_name} not found", 1, debug_level=debug_level)
+            debug_print(f"Previous preset not found: {previous_name}", 1, debug_level=debug_level)
+    else:
+        debug_print("No previous preset available", 1, debug_level=debug_level)
+
+def view_scrollbars(context, debug_level):
+    if not (context.view_hscroll and context.view_vscroll):
+        debug_print("Scrollbars missing for view action", 1, debug_level=debug_level)
+        return False
+    return True
+
+def store_view(self, context, view_key, debug_level):
+    if not view_scrollbars(context, debug_level):
+        return
+    x = context.view_hscroll.value()
+    y = context.view_vscroll.value()
+    zoom = context.canvas.zoomLevel()  # Store raw zoom
+    rotation = context.canvas.rotation()
+    self.view_states[view_key] = (x, y, zoom, rotation)
+    debug_print(f"Stored view {view_key}: x={x}, y={y}, zoom={zoom}, rotation={rotation}", 1, debug_level=debug_level)
+
+def recall_view(self, context, view_key, debug_level):
+    if not view_scrollbars(context, debug_level):
+        return
+    if self.view_states.get(view_key):
+        x, y, zoom, rotation = self.view_states[view_key]
+        with batched_updates(context):
+            context.canvas.setZoomLevel(zoom / context.zoom_scale)  # Scale on recall
+            QApplication.processEvents()  # Let the scrollbar ranges follow the new zoom
+            context.canvas.setRotation(rotation)
+            context.view_hscroll.setValue(x)
+            context.view_vscroll.setValue(y)
+        debug_print(f"Recalled view {view_key}: x={x}, y={y}, zoom={zoom}, rotation={rotation}", 1, debug_level=debug_level)
+    else:
+        debug_print(f"No view stored for {view_key}", 1, debug_level=debug_level)
+
+def toggle_lock(self, context, action_name, debug_level):
+    if action_name == "lock_rotation":
+        self.lock_rotation = not self.lock_rotation
+        self.lock_zoom = False
+        debug_print(f"Rotation lock {'enabled' if self.lock_rotation else 'disabled'}, Zoom lock disabled", 1, debug_level=debug_level)
+    elif action_name == "lock_zoom":
+        self.lock_zoom = not self.lock_zoom
+        self.lock_rotation = False
+        debug_print(f"Zoom lock {'enabled' if self.lock_zoom else 'disabled'}, Rotation lock disabled", 1, debug_level=debug_level)
+    elif action_name == "lock_both":
+        self.lock_rotation = not self.lock_rotation
+        self.lock_zoom = self.lock_rotation
+        debug_print(f"Rotation and Zoom lock {'enabled' if self.lock_rotation else 'disabled'}", 1, debug_level=debug_level)
+
+def trigger_action(self, context, action_name, debug_level):
+    action = self.docker.settings.action_index.get(action_name)  # Unknown names were reported when mapped
+    if action:
+        action.trigger()
+        debug_print(f"Triggered action: {action_name}", 4, debug_level=debug_level)
@@ -0,0 +1,64 @@
+# curve_lut.py
+import numpy as np
+
+LUT_SIZE = 257
+SOLVE_ITERATIONS = 32
+DEFAULT_CURVE = [[0.0, 0.0], [0.25, 0.25], [0.75, 0.75], [1.0, 1.0]]
+
+def cubic_bezier_array(t, p0, p1, p2, p3):
+    """Vectorized cubic Bezier for an array of t values."""
+    mt = 1.0 - t
+    return mt * mt * mt * p0 + 3.0 * mt * mt * t * p1 + 3.0 * mt * t * t * p2 + t * t * t * p3
+
+def solve_t_for_x(xs, x0, x1, x2, x3):
+    # Bisection on all inputs at once; x(t) is monotonic because the editor keeps x0 <= x1 <= x2 <= x3
+    lo = np.zeros_like(xs)
+    hi = np.ones_like(xs)
+    for _ in range(SOLVE_ITERATIONS):
+        mid = (lo + hi) * 0.5
+        below = cubic_bezier_array(mid, x0, x1, x2, x3) < xs
+        lo = np.where(below, mid, lo)
+        hi = np.where(below, hi, mid)
+    return (lo + hi) * 0.5
+
+def bake_curve_lut(points, size=LUT_SIZE):
+    """Sample the curve's output at evenly spaced true input x values in [0, 1]."""
+    (x0, y0), (x1, y1), (x2, y2), (x3, y3) = points
+    xs = np.linspace(0.0, 1.0, size)
+    t = solve_t_for_x(xs, x0, x1, x2, x3)
+    return np.clip(cubic_bezier_array(t, y0, y1, y2, y3), 0.0, 1.0)
+
+def lut_value(table, x):
+    # Scalar lookup: one index and one lerp
+    last = len(table) - 1
+    pos = (0.0 if x < 0.0 else 1.0 if x > 1.0 else x) * last
+    i = int(pos)
+    if i >= last:
+        return float(table[last])
+    frac = pos - i
+    return float(table[i] + (table[i + 1] - table[i]) * frac)
+
+class CurveBank:
+    """Baked lookup tables for all canvas curves, stored as rows of one array so they can be evaluated together."""
+
+    def __init__(self, keys, size=LUT_SIZE):
+        self.keys = tuple(keys)
+        self.rows = {key: i for i, key in enumerate(self.keys)}
+        self.size = size
+        self.tables = np.tile(bake_curve_lut(DEFAULT_CURVE, size), (len(self.keys), 1))
+
+    def table(self, key):
+        # A view into the bank; writing to it updates the shared table in place
+        return self.tables[self.rows[key]]
+
+    def bake(self, key, points):
+        self.tables[self.rows[key]] = bake_curve_lut(points, self.size)
+
+    def evaluate(self, rows, inputs):
+        # Evaluate several curves at once: rows[i] is a curve row, inputs[i] its normalized input
+        pos = np.clip(np.asarray(inputs, dtype=float), 0.0, 1.0) * (self.size - 1)
+        i0 = np.minimum(pos.astype(int), self.size - 2)
+        frac = pos - i0
+        rows = np.asarray(rows)
+        lower = self.tables[rows, i0]
+        return lower + (self.tables[rows, i0 + 1] - lower) * frac
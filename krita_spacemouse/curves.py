@@ -1,15 +1,11 @@
-from PyQt5.QtCore import QPointF, Qt
+from PyQt5.QtCore import QPointF, Qt, QTimer
 import pyqtgraph as pg
 import numpy as np
+from .curve_lut import LUT_SIZE, bake_curve_lut, cubic_bezier_array, lut_value
 
-def cubic_bezier(t, p0, p1, p2, p3):
-    """Calculate point on a cubic Bezier curve."""
-    t2 = t * t
-    t3 = t2 * t
-    mt = 1 - t
-    mt2 = mt * mt
-    mt3 = mt2 * mt
-    return mt3 * p0 + 3 * mt2 * t * p1 + 3 * mt * t2 * p2 + t3 * p3
+CURVE_SAMPLES = np.linspace(0.0, 1.0, 100)  # Curve parameter values drawn by the editor
+REDRAW_INTERVAL_MS = 16  # Coalesce drag redraws to about one per display frame
+MARKER_INTERVAL_MS = 33  # Live input marker updates at most ~30 times a second
 
 class BezierCurveEditor(pg.GraphicsLayoutWidget):
     def __init__(self, parent=None):
@@ -28,33 +24,61 @@ class BezierCurveEditor(pg.GraphicsLayoutWidget):
             QPointF(1.0, 1.0)
         ]
 
+        # Baked response table indexed by true input x; replaced by a shared CurveBank row via bind_lut()
+        self.lut = np.empty(LUT_SIZE)
+
         self.curve = self.plot.plot(pen='b')
         self.control_lines = self.plot.plot(pen='g', style=Qt.DashLine)
         self.control_points_items = [
             self.plot.plot([p.x()], [p.y()], pen=None, symbol='o', symbolPen='r', symbolSize=10)
             for p in self.control_points
         ]
+        # Where the current puck input sits on the curve; empty while no mapped axis drives it
+        self.input_marker = self.plot.plot([], [], pen=None, symbol='o', symbolBrush='y', symbolPen='k', symbolSize=9)
+        self.marker_position = None
+
+        self.redraw_timer = QTimer(self)
+        self.redraw_timer.setSingleShot(True)
+        self.redraw_timer.timeout.connect(self.update_curve)
 
         self.update_curve()
         self.plot.scene().sigMouseMoved.connect(self.on_mouse_moved)
         self.plot.scene().sigMouseClicked.connect(self.on_mouse_clicked)
         self.dragging = None
 
+    def bind_lut(self, table):
+        self.lut = table
+        self.bake_lut()
+
+    def bake_lut(self):
+        self.lut[:] = bake_curve_lut([(p.x(), p.y()) for p in self.control_points], len(self.lut))
+
     def update_curve(self):
-        t = np.linspace(0, 1, 100)
-        x = [cubic_bezier(ti, self.control_points[0].x(), self.control_points[1].x(),
-                          self.control_points[2].x(), self.control_points[3].x()) for ti in t]
-        y = [cubic_bezier(ti, self.control_points[0].y(), self.control_points[1].y(),
-                          self.control_points[2].y(), self.control_points[3].y()) for ti in t]
-        self.curve.setData(x, y)
-        self.control_lines.setData(
-            [p.x() for p in self.control_points],
-            [p.y() for p in self.control_points]
-        )
-        for i, item in enumerate(self.control_points_items):
-            item.setData([self.control_points[i].x()], [self.control_points[i].y()])
-        self.plot.getViewBox().update()  # Fixed: Use getViewBox() instead of plotItem.vb
-        self.plot.replot()  # Force full replot
+        self.redraw_timer.stop()
+        self.bake_lut()
+        xs = [p.x() for p in self.control_points]
+        ys = [p.y() for p in self.control_points]
+        self.curve.setData(cubic_bezier_array(CURVE_SAMPLES, *xs), cubic_bezier_array(CURVE_SAMPLES, *ys))
+        self.control_lines.setData(xs, ys)
+        for item, x, y in zip(self.control_points_items, xs, ys):
+            item.setData([x], [y])
+        if self.marker_position is not None:
+            self.set_marker(self.marker_position[0], force=True)  # Follow the reshaped curve
+
+    def schedule_redraw(self):
+        if not self.redraw_timer.isActive():
+            self.redraw_timer.start(REDRAW_INTERVAL_MS)
+
+    def set_marker(self, x, force=False):
+        if x is None:
+            if self.marker_position is not None:
+                self.marker_position = None
+                self.input_marker.setData([], [])
+            return
+        position = (x, lut_value(self.lut, x))
+        if force or position != self.marker_position:
+            self.marker_position = position
+            self.input_marker.setData([position[0]], [position[1]])
 
     def on_mouse_moved(self, pos):
         if self.dragging is not None and self.dragging in [1, 2]:
@@ -65,12 +89,22 @@ class BezierCurveEditor(pg.GraphicsLayoutWidget):
             elif self.dragging == 2:
                 x = max(x, self.control_points[1].x())
             self.control_points[self.dragging] = QPointF(x, y)
-            self.update_curve()
-            if hasattr(self, 'parent_widget'):
-                self.parent_widget.save_current_settings()
+            self.schedule_redraw()
+
+    def end_drag(self):
+        # Settings are written once per drag, when the point is dropped
+        if self.dragging is None:
+            return
+        self.dragging = None
+        self.update_curve()
+        if hasattr(self, 'parent_widget'):
+            self.parent_widget.save_current_settings()
 
     def on_mouse_clicked(self, event):
         if event.button() == Qt.LeftButton:
+            if self.dragging is not None:
+                self.end_drag()  # A second click drops the point
+                return
             pos = self.plot.vb.mapSceneToView(event.scenePos())
             x, y = pos.x(), pos.y()
             for i, p in enumerate(self.control_points):
@@ -78,9 +112,11 @@ class BezierCurveEditor(pg.GraphicsLayoutWidget):
                     self.dragging = i
                     return
         elif event.button() == Qt.RightButton:
-            self.dragging = None
+            self.end_drag()
+
+    def hideEvent(self, event):
+        self.end_drag()  # Switching axes or tabs mid-drag keeps the edit
+        super().hideEvent(event)
 
     def get_curve_value(self, input_val):
-        t = max(0, min(1, input_val))
-        return cubic_bezier(t, self.control_points[0].y(), self.control_points[1].y(),
-                            self.control_points[2].y(), self.control_points[3].y())
+        return lut_value(self.lut, input_val)
@@ -2,17 +2,53 @@
 from PyQt5.QtWidgets import QDockWidget, QWidget, QVBoxLayout, QTabWidget, QApplication
 from PyQt5.QtCore import Qt
 from krita import Krita
-from .tabs.buttons_tab import ButtonsTab
-from .tabs.curves_tab import CurvesTab
 from .tabs.advanced_tab import AdvancedTab
-from .tabs.log_tab import LogTab
 from .configurator import ConfigDialogs
 from .settings import SettingsManager
-from .utils import debug_print
+from .action_catalog import ActionCatalog
+from .utils import debug_print, timed_phase
+
+class LazyTab(QWidget):
+    """Tab placeholder that builds the real tab the first time it is shown and stores it on the docker."""
+
+    def __init__(self, docker, attribute, factory):
+        super().__init__()
+        self.docker = docker
+        self.attribute = attribute
+        self.factory = factory
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(0, 0, 0, 0)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.factory is None:
+            return
+        factory, self.factory = self.factory, None
+        with timed_phase(f"tab.{self.attribute}"):
+            tab = factory(self.docker)
+        setattr(self.docker, self.attribute, tab)
+        self.layout.addWidget(tab)
+        debug_print(f"{type(tab).__name__} built on first show", 1, debug_level=self.docker.debug_level_value)
+
+def build_buttons_tab(docker):
+    from .tabs.buttons_tab import ButtonsTab
+    return ButtonsTab(docker)
+
+def build_curves_tab(docker):
+    from .tabs.curves_tab import CurvesTab  # Pulls in pyqtgraph and numpy
+    return CurvesTab(docker)
+
+def build_log_tab(docker):
+    from .tabs.log_tab import LogTab
+    return LogTab(docker)
 
 class SpacenavDocker(QDockWidget):
     def __init__(self):
         super().__init__()
+        with timed_phase("docker.__init__"):
+            self.build()
+
+    def build(self):
         print("[PRE-INIT 1] Starting SpacenavDocker __init__")
         debug_print("Step 1: Starting SpacenavDocker __init__", 1, debug_level=1)
         self.setObjectName("spacenavDocker")
@@ -40,6 +76,9 @@ class SpacenavDocker(QDockWidget):
             debug_print(f"Stack trace: {traceback.format_exc()}", 1, debug_level=self.debug_level_value, force=True)
             self.settings = None
 
+        # Shared by the button and puck dialogs; fills itself in the background once startup returns to the event loop
+        self.action_catalog = ActionCatalog(lambda: self.debug_level_value)
+
         self.tabs = QTabWidget()
         self.layout.addWidget(self.tabs)
         print("[PRE-INIT 4] Tabs widget added")
@@ -49,24 +88,19 @@ class SpacenavDocker(QDockWidget):
         self.axis_settings_container.setLayout(QVBoxLayout())
         self.axis_settings_container.setVisible(False)
 
-        print("[PRE-INIT 5] Before ButtonsTab")
-        self.buttons_tab = ButtonsTab(self)
-        debug_print("Step 5: ButtonsTab initialized", 1, debug_level=self.debug_level_value)
-        self.curves_tab = CurvesTab(self)
-        debug_print("Step 6: CurvesTab initialized", 1, debug_level=self.debug_level_value)
+        # Buttons, Curves and Log are built on first show (see LazyTab), which sets self.buttons_tab/curves_tab/log_tab;
+        # until then settings read and write the values they hold themselves. Advanced is eager because load_settings() fills it.
+        print("[PRE-INIT 5] Before tabs")
         self.advanced_tab = AdvancedTab(self)
-        debug_print("Step 7: AdvancedTab initialized", 1, debug_level=self.debug_level_value)
-        print("[PRE-INIT 8] LogTab initialized")
-        self.log_tab = LogTab(self)
-        debug_print("Step 8: LogTab initialized", 1, debug_level=self.debug_level_value)
+        debug_print("Step 5: AdvancedTab initialized", 1, debug_level=self.debug_level_value)
 
         self.config_dialogs = ConfigDialogs(self)
         debug_print("Step 9: ConfigDialogs initialized", 1, debug_level=self.debug_level_value)
 
-        self.tabs.addTab(self.buttons_tab, "Buttons")
-        self.tabs.addTab(self.curves_tab, "Curves")
+        self.tabs.addTab(LazyTab(self, "buttons_tab", build_buttons_tab), "Buttons")
+        self.tabs.addTab(LazyTab(self, "curves_tab", build_curves_tab), "Curves")
         self.tabs.addTab(self.advanced_tab, "Advanced")
-        self.tabs.addTab(self.log_tab, "Log")
+        self.tabs.addTab(LazyTab(self, "log_tab", build_log_tab), "Log")
         debug_print("Step 10: Tabs added to QTabWidget", 1, debug_level=self.debug_level_value)
 
         if self.settings:
@@ -101,8 +135,7 @@ class SpacenavDocker(QDockWidget):
 
     def update_polling_rate(self, value):
         if hasattr(self, 'extension'):
-            self.extension.timer.stop()
-            self.extension.timer.start(value)
+            self.extension.set_polling_interval(value)
             self.advanced_tab.polling_label.setText(f"Polling Rate: {value}ms ({1000/value:.1f}Hz)")
             debug_print(f"Polling rate set to {value}ms ({1000/value:.1f}Hz)", 1, debug_level=self.debug_level_value)
         if not hasattr(self, 'settings'):
@@ -112,6 +145,45 @@ class SpacenavDocker(QDockWidget):
         else:
             self.settings.save_current_settings()
 
+    def update_input_mode(self, index):
+        mode = self.advanced_tab.input_mode.itemData(index)
+        if hasattr(self, 'extension'):
+            self.extension.set_input_mode(mode)
+        debug_print(f"Input mode set to {mode}", 1, debug_level=self.debug_level_value)
+        self.save_current_settings()
+
+    def update_coalescing_policy(self, index):
+        policy = self.advanced_tab.coalescing_policy.itemData(index)
+        if hasattr(self, 'extension'):
+            self.extension.coalescer.set_policy(policy)
+        debug_print(f"Motion coalescing set to {policy}", 1, debug_level=self.debug_level_value)
+        self.save_current_settings()
+
+    def toggle_recording(self, checked):
+        if not hasattr(self, 'extension'):
+            debug_print("Cannot record: extension not linked", 1, debug_level=self.debug_level_value)
+            self.advanced_tab.set_recording(None)
+            return
+        if checked:
+            self.advanced_tab.set_recording(self.extension.start_recording())
+        else:
+            self.extension.stop_recording()
+            self.advanced_tab.set_recording(None)
+
+    def update_spnav_backend(self, index):
+        backend = self.advanced_tab.spnav_backend.itemData(index)
+        if hasattr(self, 'extension'):
+            self.extension.set_backend(backend)
+        debug_print(f"SpaceMouse backend set to {backend}", 1, debug_level=self.debug_level_value)
+        self.save_current_settings()
+
+    def update_zoom_anchor(self, index):
+        anchor = self.advanced_tab.zoom_anchor.itemData(index)
+        if hasattr(self, 'extension'):
+            self.extension.zoom_anchor = anchor
+        debug_print(f"Zoom anchor set to {anchor}", 1, debug_level=self.debug_level_value)
+        self.save_current_settings()
+
     def save_current_settings(self):
         if not hasattr(self, 'settings'):
             debug_print("self.settings not defined", 1, debug_level=self.debug_level_value)
@@ -131,8 +203,7 @@ class SpacenavDocker(QDockWidget):
                     polling_interval = self.extension.polling_interval
                     self.advanced_tab.polling_slider.setValue(polling_interval)
                     self.advanced_tab.polling_label.setText(f"Polling Rate: {polling_interval}ms ({1000/polling_interval:.1f}Hz)")
-                    self.extension.timer.stop()
-                    self.extension.timer.start(polling_interval)
+                    self.extension.set_polling_interval(polling_interval)
                     self.dead_zone_slider_value = self.extension.global_dead_zone
                     self.advanced_tab.dead_zone_slider.setValue(self.dead_zone_slider_value)
                     self.advanced_tab.dead_zone_label.setText(f"Global Dead Zone: {self.dead_zone_slider_value}")
@@ -151,9 +222,7 @@ class SpacenavDocker(QDockWidget):
                 self.advanced_tab.long_press_slider.setValue(500)
                 self.advanced_tab.long_press_label.setText(f"Long Press Duration: 500ms")
                 if hasattr(self, 'extension'):
-                    self.extension.polling_interval = 10
-                    self.extension.timer.stop()
-                    self.extension.timer.start(10)
+                    self.extension.set_polling_interval(10)
                     self.advanced_tab.polling_slider.setValue(10)
                     self.advanced_tab.polling_label.setText(f"Polling Rate: 10ms ({1000/10:.1f}Hz)")
                     self.dead_zone_slider_value = 130
@@ -170,4 +239,10 @@ class SpacenavDocker(QDockWidget):
 
     def set_extension(self, extension):
         self.extension = extension
+        # Settings loaded by the docker win over the defaults the extension started with
+        self.extension.set_input_mode(self.advanced_tab.input_mode.currentData())
+        self.extension.coalescer.set_policy(self.advanced_tab.coalescing_policy.currentData())
+        self.extension.zoom_anchor = self.advanced_tab.zoom_anchor.currentData()
+        self.extension.set_backend(self.advanced_tab.spnav_backend.currentData())
+        self.extension.scheduler.idle_timeout = self.advanced_tab.idle_timeout_slider.value()
         debug_print("Extension linked to docker", 1, debug_level=self.debug_level_value)
@@ -2,22 +2,22 @@
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QMdiArea, QScrollBar, QAbstractScrollArea
 from krita import Krita
-from krita_spacemouse.spnav import libspnav, SPNAV_EVENT_MOTION, SPNAV_EVENT_BUTTON
+from krita_spacemouse.spnav import SPNAV_EVENT_ANY, SPNAV_EVENT_MOTION, SPNAV_EVENT_BUTTON
 from krita_spacemouse.utils import debug_print
 from krita_spacemouse.button_handler import process_button_event
 from krita_spacemouse.motion_handler import process_motion_event
+from krita_spacemouse.motion_coalescer import AXES
+from krita_spacemouse.input_reader import STALL_LOG_MS
 import ctypes
-from time import time
+from time import time, monotonic_ns
 
 def poll_spacenav(self):
     try:
         current_time = int(time() * 1000)
-        window = Krita.instance().activeWindow()
-        if not window or not window.activeView():
+        if not self.view_context.resolve():
             debug_print("No active window or view found", 1, debug_level=self.docker.debug_level_value if self.docker else 1)
+            discard_pending_events(self)
             return
-        view = window.activeView()
-        canvas = view.canvas()
 
         if not self.docker:
             dockers = Krita.instance().dockers()
@@ -29,6 +29,7 @@ def poll_spacenav(self):
                     break
             else:
                 debug_print("Docker not found, using defaults", 1, debug_level=1)
+                discard_pending_events(self)
                 return
         docker = self.docker
         if not hasattr(self, '_debug_level_logged'):
@@ -36,41 +37,85 @@ def poll_spacenav(self):
             self._debug_level_logged = True
 
         num_events = 0
-        latest_inputs = self.last_motion_data.copy()
-        while True:
-            result = libspnav.spnav_poll_event(ctypes.byref(self.event))
-            if result == 0:
-                break
+        coalescer = self.coalescer
+        for sample in read_samples(self):
             num_events += 1
-            debug_print(f"Poll result: {result}, Events: {num_events}", 2, debug_level=docker.debug_level_value)
-            if self.event.type == SPNAV_EVENT_BUTTON:
-                process_button_event(self, self.event.event.button.bnum, self.event.event.button.press == 1)
-            elif self.event.type == SPNAV_EVENT_MOTION:
-                axis_inputs = {
-                    "x": self.event.event.motion.x, "y": self.event.event.motion.y, "z": self.event.event.motion.z,
-                    "rx": self.event.event.motion.rx, "ry": self.event.event.motion.ry, "rz": self.event.event.motion.rz
-                }
-                debug_print(f"Raw SN inputs: {axis_inputs}", 2, debug_level=docker.debug_level_value)
-                latest_inputs = axis_inputs.copy()
-                process_motion_event(self, latest_inputs)
+            event_type = sample[1]
+            debug_print("Poll result: %d, Events: %d", 2, debug_level=docker.debug_level_value, args=(event_type, num_events))
+            if event_type == SPNAV_EVENT_BUTTON:
+                process_button_event(self, sample[2], sample[3] == 1)
+            elif event_type == SPNAV_EVENT_MOTION:
+                coalescer.add(*sample[2:9])
+                if docker.debug_level_value >= 2:
+                    values = sample[2:8]
+                    debug_print(lambda: f"Raw SN inputs: {dict(zip(AXES, values))}", 2, debug_level=docker.debug_level_value,
+                                fields={"key": "raw_inputs", "values": values})
+        if num_events and self.scheduler:
+            self.scheduler.activity()
+        if self.reader and self.reader.last_stall_ms >= STALL_LOG_MS:
+            debug_print("GUI thread blocked input for %.1fms (max %.1fms, %d samples dropped)", 1, debug_level=docker.debug_level_value,
+                        args=(self.reader.last_stall_ms, self.reader.max_stall_ms, self.reader.dropped))
 
-        if num_events > 0:
-            debug_print("Polling SpaceNavigator...", 2, debug_level=docker.debug_level_value)
+        # Apply every motion packet of this drain as one combined sample and a single canvas update
+        combined = coalescer.take()
+        if combined:
+            sample, packets, period_ms = combined
+            latest_inputs = dict(zip(AXES, sample))
+            time_scale = self.integrator.time_scale(period_ms)
+            debug_print("Coalesced %d motion packets over %dms (%s, time scale %.2f)", 2, debug_level=docker.debug_level_value,
+                        args=(packets, period_ms, coalescer.policy, time_scale))
+            process_motion_event(self, sample, time_scale)
             self.last_motion_data = latest_inputs
+            for listener in self.motion_listeners:
+                listener(sample)
             if self.last_logged_motion != self.last_motion_data:
-                debug_print(f"Motion data stored: {self.last_motion_data}", 2, debug_level=docker.debug_level_value)
+                debug_print("Motion data stored: %s", 2, debug_level=docker.debug_level_value, args=(latest_inputs,),
+                            fields={"key": "motion_data", "values": sample})
                 self.last_logged_motion = self.last_motion_data.copy()
-            if num_events > 5:
-                cleared = libspnav.spnav_remove_events(SPNAV_EVENT_MOTION)
-                debug_print(f"Cleared {cleared} motion events after {num_events} processed", 1, debug_level=docker.debug_level_value)
+        else:
+            self.integrator.idle()
 
         self.last_motion_time = current_time
 
     except OSError as e:
         debug_print(f"Socket error in poll: {e}", 1, debug_level=self.docker.debug_level_value if self.docker else 1)
-        self.timer.stop()
+        self.stop_input()
     except AttributeError as e:
         debug_print(f"Krita API error in poll: {e}", 1, debug_level=self.docker.debug_level_value if self.docker else 1)
+    except RuntimeError as e:
+        # A cached view handle was deleted underneath us; resolve it again on the next tick
+        debug_print(f"Stale view handle in poll: {e}", 1, debug_level=self.docker.debug_level_value if self.docker else 1)
+        self.view_context.invalidate()
     except Exception as e:
         debug_print(f"Unexpected error in poll: {e}", 1, debug_level=self.docker.debug_level_value if self.docker else 1)
-        self.timer.stop()
+        self.stop_input()
+
+def read_samples(self):
+    # Samples share the reader thread's layout: (timestamp_ns, type, a, b, c, d, e, f, g)
+    if self.reader:
+        samples = self.reader.drain()
+    elif hasattr(self.spnav, "read_samples"):
+        # Batched backends decode a whole socket read at once
+        samples = self.spnav.read_samples()
+    else:
+        samples = []
+        spnav = self.spnav
+        event = self.event
+        event_ref = ctypes.byref(event)
+        now = monotonic_ns()
+        while spnav.spnav_poll_event(event_ref):
+            if event.type == SPNAV_EVENT_MOTION:
+                m = event.event.motion
+                samples.append((now, SPNAV_EVENT_MOTION, m.x, m.y, m.z, m.rx, m.ry, m.rz, m.period))
+            elif event.type == SPNAV_EVENT_BUTTON:
+                samples.append((now, SPNAV_EVENT_BUTTON, event.event.button.bnum, event.event.button.press, 0, 0, 0, 0, 0))
+    if self.recorder:
+        self.recorder.write(samples)
+    return samples
+
+def discard_pending_events(self):
+    # The socket notifier keeps firing while data is unread, so drop events we cannot apply
+    if self.reader:
+        self.reader.clear()
+    elif self.notifier:
+        self.spnav.spnav_remove_events(SPNAV_EVENT_ANY)
@@ -1,19 +1,30 @@
 # extension.py
-from PyQt5.QtCore import QTimer, Qt
-from PyQt5.QtWidgets import QApplication, QScrollBar, QMdiArea, QDockWidget, QMessageBox
+from PyQt5.QtCore import QTimer, QSocketNotifier, Qt
+from PyQt5.QtWidgets import QDockWidget, QMessageBox
 from krita import Extension, Krita, DockWidgetFactory, DockWidgetFactoryBase
-from .spnav import libspnav, SpnavEventWrapper, SPNAV_EVENT_BUTTON, SPNAV_EVENT_MOTION
+from . import spnav as spnav_module
+from .spnav import select_backend, SpnavEventWrapper, SPNAV_EVENT_ANY, SPNAV_EVENT_MOTION
+from .spnav_socket import find_socket_path
 from .docker import SpacenavDocker
-from .utils import debug_print
+from .utils import debug_print, load_settings, timed_phase, startup_report
 from .event_handler import poll_spacenav
-import os
-import ctypes
+from .motion_coalescer import MotionCoalescer
+from .integrator import MotionIntegrator
+from .view_context import ViewContext
+from .transform import TransformAccumulator
+from .input_reader import InputReader
+from .scheduler import AdaptiveScheduler
+from .recorder import EventRecorder
+from .button_dispatcher import ButtonDispatcher
 
 class SpacenavControlExtension(Extension):
     def __init__(self, parent):
         super().__init__(parent)
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.poll_spacenav)
+        self.spnav = None
+        self.notifier = None
+        self.reader = None
+        self.recorder = None
+        self.connected = False
         self.event = SpnavEventWrapper()
         self.current_zoom = 1.0
         self.docker = None
@@ -21,63 +32,96 @@ class SpacenavControlExtension(Extension):
         self.debounce_ms = 5
         self.last_dx = self.last_dy = self.last_zoom_delta = self.last_rotation_delta = 0
         self.last_motion_data = {"x": 0, "y": 0, "z": 0, "rx": 0, "ry": 0, "rz": 0}
+        self.motion_listeners = []  # Called with each coalesced motion sample, e.g. the puck dialog's axis meter
         self.last_logged_motion = None
         self.button_states = {}
         self.modifier_states = {"Shift": False, "Ctrl": False, "Alt": False}
-        self.recent_presets = []
         self.view_states = {"V1": None, "V2": None, "V3": None}  # (x, y, zoom, rotation)
         self.lock_rotation = False
         self.lock_zoom = False
         self.debug_level_value = 1
-        from .settings import SettingsManager
-        settings_manager = SettingsManager(self, load=False)  # Temp instance to peek at settings
-        settings = settings_manager.load_settings()
+        settings = load_settings()  # Only the raw values; the docker's SettingsManager owns the full state
         self.polling_interval = settings.get("polling_interval", 10) if settings else 10
         self.global_dead_zone = settings.get("global_dead_zone", 130) if settings else 130
         self.global_sensitivity = settings.get("global_sensitivity", 100) if settings else 100
         self.long_press_duration = settings.get("long_press_duration", 500) if settings else 500
-        debug_print(f"SpacenavControlExtension initialized with polling_interval={self.polling_interval}ms", 1, debug_level=self.debug_level_value)
+        self.idle_timeout = settings.get("idle_timeout", 1000) if settings else 1000
+        self.input_mode = settings.get("input_mode", "notifier") if settings else "notifier"
+        self.backend = settings.get("spnav_backend", "auto") if settings else "auto"
+        self.zoom_anchor = settings.get("zoom_anchor", "center") if settings else "center"
+        self.view_context = ViewContext(self)
+        self.transform = TransformAccumulator(self)
+        self.button_dispatcher = ButtonDispatcher(self)
+        self.scheduler = AdaptiveScheduler(self.poll_spacenav, self.polling_interval, self.idle_timeout,
+                                           lambda: self.docker.debug_level_value if self.docker else self.debug_level_value)
+        self.scheduler.suspended_changed.connect(self.set_suspended)
+        self.integrator = MotionIntegrator()
+        self.coalescer = MotionCoalescer(settings.get("motion_coalescing", "mean") if settings else "mean")
+        debug_print(f"SpacenavControlExtension initialized with polling_interval={self.polling_interval}ms, input_mode={self.input_mode}", 1, debug_level=self.debug_level_value)
 
     def setup(self):
         debug_print("SpacenavControlExtension: Setting up...", 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
+        with timed_phase("extension.setup"):
+            Krita.instance().notifier().applicationClosing.connect(self.stop)
+            try:
+                Krita.instance().addDockWidgetFactory(
+                    DockWidgetFactory("spacenavDocker", DockWidgetFactoryBase.DockRight, SpacenavDocker)
+                )
+                debug_print("Docker factory registered", 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
+            except Exception as e:
+                debug_print(f"Error registering docker: {e}", 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
+        # Talking to the daemon waits until Krita's window is up and the event loop is running
+        QTimer.singleShot(0, self.connect_input)
 
+    def connect_input(self):
+        with timed_phase("connect"):
+            self.open_device()
+        debug_print(startup_report(), 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
+
+    def open_device(self):
         # Dynamic socket detection
-        possible_socket_paths = [
-            "/var/run/spnav.sock",          # Arch Linux default
-            "/tmp/.spnav.sock",             # Common on other distros
-            os.path.join(os.environ.get("XDG_RUNTIME_DIR", "/tmp"), "spnav.sock"),  # XDG fallback
-            os.environ.get("SPNAV_SOCKPATH")  # Custom env var, if set
-        ]
-        socket_path = None
-        for path in possible_socket_paths:
-            if path and os.path.exists(path):
-                socket_path = path
-                debug_print(f"SpaceMouse socket found at {socket_path}", 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
-                break
-
-        if not socket_path:
+        socket_path = find_socket_path()
+        if socket_path:
+            debug_print(f"SpaceMouse socket found at {socket_path}", 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
+        else:
             QMessageBox.warning(None, "SpaceMouse Error", "No SpaceMouse socket found. Check if spacenavd is running.")
             debug_print("Error: No SpaceMouse socket found at common locations (/var/run/spnav.sock, /tmp/.spnav.sock, XDG_RUNTIME_DIR/spnav.sock, or SPNAV_SOCKPATH)", 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
             return  # Skip SpaceMouse setup but don’t crash
 
-        # Set the socket path for libspnav (if needed, depends on implementation)
-        # Note: libspnav typically uses X11 or autodetects; we assume it checks the socket
-        result = libspnav.spnav_open()
+        if not self.connect_backend(socket_path):
+            return
+        self.scheduler.check_suspended()
+        self.start_input()
+
+    def connect_backend(self, socket_path=None):
+        # libspnav autodetects the daemon; the socket backend connects to socket_path directly
+        spnav = select_backend(self.backend, socket_path)
+        if spnav is None:
+            debug_print(f"Error: SpaceMouse backend '{self.backend}' is not available", 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
+            return False
+        result = spnav.spnav_open()
         if result == -1:
             debug_print(f"Error: Failed to connect to SpaceNavigator daemon at {socket_path}", 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
-            return
-        debug_print("Connected to SpaceNavigator daemon", 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
-        cleared = libspnav.spnav_remove_events(SPNAV_EVENT_MOTION)
+            return False
+        self.spnav = spnav
+        debug_print(f"Connected to SpaceNavigator daemon via {'libspnav' if spnav is spnav_module.libspnav else 'socket'}", 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
+        self.connected = True
+        cleared = spnav.spnav_remove_events(SPNAV_EVENT_MOTION)
         debug_print(f"Initial queue clear: {cleared} motion events", 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
-        self.timer.start(self.polling_interval)
+        return True
 
-        try:
-            Krita.instance().addDockWidgetFactory(
-                DockWidgetFactory("spacenavDocker", DockWidgetFactoryBase.DockRight, SpacenavDocker)
-            )
-            debug_print("Docker factory registered", 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
-        except Exception as e:
-            debug_print(f"Error registering docker: {e}", 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
+    def set_backend(self, backend):
+        if backend == self.backend:
+            return
+        self.backend = backend
+        if not self.connected:
+            return
+        # Reconnect through the new backend
+        self.stop_input()
+        self.spnav.spnav_close()
+        self.connected = False
+        if self.connect_backend(find_socket_path()):
+            self.start_input()
 
     def createActions(self, window):
         debug_print("createActions called", 3, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
@@ -94,10 +138,87 @@ class SpacenavControlExtension(Extension):
     def poll_spacenav(self):
         poll_spacenav(self)
 
+    def start_input(self):
+        # Watch the daemon socket and only wake up when events arrive; fall back to timer polling
+        self.stop_input()
+        if not self.connected or self.scheduler.suspended:
+            return
+        if self.input_mode == "thread":
+            # A worker thread drains the daemon even while the GUI thread is blocked
+            self.reader = InputReader(self.spnav, self.spnav.spnav_fd(), self.polling_interval)
+            self.reader.samples_ready.connect(self.poll_spacenav, Qt.QueuedConnection)
+            self.reader.start()
+            debug_print(f"Reader thread input enabled on fd {self.reader.fd}", 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
+            return
+        if self.input_mode == "notifier":
+            fd = self.spnav.spnav_fd()
+            if fd >= 0:
+                self.notifier = QSocketNotifier(fd, QSocketNotifier.Read)
+                self.notifier.activated.connect(self.poll_spacenav)
+                debug_print(f"Event-driven input enabled on fd {fd}", 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
+                return
+            debug_print("spnav_fd unavailable, falling back to timer polling", 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
+        self.scheduler.start(self.polling_interval)
+        debug_print(f"Adaptive timer polling enabled, idling at {self.polling_interval}ms", 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
+
+    def stop_input(self):
+        self.scheduler.stop()
+        if self.notifier:
+            self.notifier.setEnabled(False)
+            self.notifier.activated.disconnect()
+            self.notifier.deleteLater()
+            self.notifier = None
+        if self.reader:
+            self.reader.stop()
+            self.reader.samples_ready.disconnect()
+            self.reader = None
+        self.button_dispatcher.reset()  # Releases for buttons held now will not be read
+
+    def set_suspended(self, suspended):
+        # Krita lost focus or closed its last document: stop reading until it can use input again
+        if suspended:
+            self.stop_input()
+        elif self.connected:
+            self.spnav.spnav_remove_events(SPNAV_EVENT_ANY)  # Drop what piled up meanwhile
+            self.start_input()
+
+    def set_input_mode(self, mode):
+        if mode == self.input_mode:
+            return
+        self.input_mode = mode
+        self.start_input()
+
+    def start_recording(self, path=None):
+        self.stop_recording()
+        try:
+            self.recorder = EventRecorder(path)
+        except OSError as e:
+            debug_print(f"Error starting recording: {e}", 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
+            return None
+        debug_print(f"Recording device events to {self.recorder.path}", 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
+        return self.recorder.path
+
+    def stop_recording(self):
+        if self.recorder:
+            self.recorder.close()
+            debug_print(f"Recorded {self.recorder.count} events to {self.recorder.path}", 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
+            self.recorder = None
+
+    def set_polling_interval(self, value):
+        self.polling_interval = value
+        if self.reader:
+            self.reader.polling_interval = value
+        self.scheduler.set_idle_interval(value)
+
     def stop(self):
         try:
-            self.timer.stop()
-            libspnav.spnav_close()
+            self.stop_input()
+            self.stop_recording()
+            if self.docker and self.docker.settings:
+                self.docker.settings.writer.shutdown()  # Write any debounced changes before exiting
+            if self.spnav:
+                self.spnav.spnav_close()
+            self.connected = False
             debug_print("SpacenavControlExtension: Stopped.", 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
         except Exception as e:
             debug_print(f"Error in stop: {e}", 1, debug_level=self.docker.debug_level_value if self.docker else self.debug_level_value)
@@ -0,0 +1,111 @@
+# input_reader.py
+import ctypes
+import select
+import threading
+import time
+from collections import deque
+from PyQt5.QtCore import QObject, pyqtSignal
+from .spnav import SpnavEventWrapper, SPNAV_EVENT_MOTION, SPNAV_EVENT_BUTTON
+
+RING_CAPACITY = 4096  # About 30s of motion at the daemon's usual rate
+SELECT_TIMEOUT_S = 0.05  # Upper bound on how long stop() waits for the thread
+STALL_LOG_MS = 50
+
+class InputReader(QObject):
+    """Drains the spnav backend on a worker thread into a ring buffer the GUI thread consumes once per frame."""
+    # Emitted from the worker thread; Qt queues it onto the GUI thread
+    samples_ready = pyqtSignal()
+
+    def __init__(self, spnav, fd, polling_interval=10, capacity=RING_CAPACITY):
+        super().__init__()
+        self.spnav = spnav
+        self.fd = fd
+        self.polling_interval = polling_interval
+        # Samples are (timestamp_ns, type, a, b, c, d, e, f, g): x, y, z, rx, ry, rz, period for
+        # motion and bnum, press for buttons. deque append/popleft are atomic, so no lock is needed.
+        self.ring = deque(maxlen=capacity)
+        self.dropped = 0
+        self.signal_pending = threading.Event()
+        self.signal_time_ns = 0
+        self.last_stall_ms = 0.0
+        self.max_stall_ms = 0.0
+        self.running = threading.Event()
+        self.event = SpnavEventWrapper()
+        self.event_ref = ctypes.byref(self.event)
+        self.thread = None
+
+    def start(self):
+        if self.thread:
+            return
+        self.running.set()
+        self.thread = threading.Thread(target=self.run, name="spacemouse-reader", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running.clear()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+    def run(self):
+        while self.running.is_set():
+            if not self.wait_readable():
+                continue
+            try:
+                samples = self.read()
+            except OSError:
+                self.running.clear()  # The daemon connection is gone
+                return
+            overflow = len(self.ring) + len(samples) - self.ring.maxlen
+            if overflow > 0:
+                self.dropped += overflow  # The GUI thread fell a whole buffer behind; the oldest samples go
+            self.ring.extend(samples)
+            if self.ring and not self.signal_pending.is_set():
+                # One queued signal per GUI frame, however many samples arrive before it runs
+                self.signal_time_ns = time.monotonic_ns()
+                self.signal_pending.set()
+                self.samples_ready.emit()
+
+    def read(self):
+        spnav = self.spnav
+        if hasattr(spnav, "read_samples"):
+            return spnav.read_samples()
+        samples = []
+        event = self.event
+        while spnav.spnav_poll_event(self.event_ref):
+            now = time.monotonic_ns()
+            if event.type == SPNAV_EVENT_MOTION:
+                m = event.event.motion
+                samples.append((now, SPNAV_EVENT_MOTION, m.x, m.y, m.z, m.rx, m.ry, m.rz, m.period))
+            elif event.type == SPNAV_EVENT_BUTTON:
+                b = event.event.button
+                samples.append((now, SPNAV_EVENT_BUTTON, b.bnum, b.press, 0, 0, 0, 0, 0))
+        return samples
+
+    def wait_readable(self):
+        if self.fd < 0:
+            # No socket to wait on; sleep for one polling interval instead
+            time.sleep(self.polling_interval / 1000.0)
+            return True
+        try:
+            readable, _, _ = select.select([self.fd], [], [], SELECT_TIMEOUT_S)
+        except (OSError, ValueError):
+            self.running.clear()  # The daemon connection is gone
+            return False
+        return bool(readable)
+
+    def drain(self):
+        # GUI thread: take everything queued so far and measure how long the signal waited for us
+        if self.signal_pending.is_set():
+            self.last_stall_ms = (time.monotonic_ns() - self.signal_time_ns) / 1e6
+            self.max_stall_ms = max(self.max_stall_ms, self.last_stall_ms)
+            self.signal_pending.clear()
+        ring = self.ring
+        samples = []
+        while ring:
+            samples.append(ring.popleft())
+        return samples
+
+    def clear(self):
+        self.signal_pending.clear()
+        self.ring.clear()
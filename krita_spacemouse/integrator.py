@@ -0,0 +1,51 @@
+# integrator.py
+import time
+
+REFERENCE_TICK_MS = 10.0  # Speeds are tuned per 10ms, the old default polling interval
+MAX_TICK_MS = 50.0  # Longer gaps (puck at rest, GUI stalls) are not made up in one jump
+QUIET_MS = MAX_TICK_MS  # No packet for this long means the puck is at rest, several device report periods
+WHOLE_TARGETS = ("X", "Y", "Rotation")  # Applied in whole pixels / degrees
+
+class MotionIntegrator:
+    """Scale per-tick motion by real elapsed time and carry the fractions that whole-unit targets drop."""
+
+    def __init__(self):
+        self.last_ns = None
+        self.remainders = dict.fromkeys(WHOLE_TARGETS, 0.0)
+
+    def time_scale(self, device_ms=0):
+        # Prefer the time covered by the device's own packet periods; fall back to the tick clock
+        now = time.monotonic_ns()
+        if device_ms > 0:
+            elapsed = device_ms
+        elif self.last_ns is None:
+            elapsed = REFERENCE_TICK_MS
+        else:
+            elapsed = (now - self.last_ns) / 1e6
+            if elapsed > QUIET_MS:
+                # Input resumed after a rest that idle() did not see (the notifier only polls on input)
+                elapsed = REFERENCE_TICK_MS
+        self.last_ns = now
+        return min(elapsed, MAX_TICK_MS) / REFERENCE_TICK_MS
+
+    def idle(self):
+        # Polls between device reports are usually empty, so only a real quiet period restarts the clock and
+        # forgets fractions; resetting on every empty poll would drop slow sub-pixel motion entirely
+        if self.last_ns is None or (time.monotonic_ns() - self.last_ns) / 1e6 < QUIET_MS:
+            return
+        self.last_ns = None
+        for target in WHOLE_TARGETS:
+            self.remainders[target] = 0.0
+
+    def whole(self, target, amount):
+        # Add amount to the target's running total and hand out the whole units, keeping the fraction
+        total = self.remainders[target] + amount
+        whole = int(total)
+        self.remainders[target] = total - whole
+        return whole
+
+    def settle(self, active_targets):
+        # Targets whose axis went back inside the dead zone drop their leftover fraction
+        for target in WHOLE_TARGETS:
+            if target not in active_targets:
+                self.remainders[target] = 0.0
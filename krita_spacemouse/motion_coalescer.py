@@ -0,0 +1,54 @@
+# motion_coalescer.py
+from .integrator import REFERENCE_TICK_MS, QUIET_MS
+
+AXES = ("x", "y", "z", "rx", "ry", "rz")
+COALESCING_POLICIES = ("latest", "mean")
+
+class MotionCoalescer:
+    """Combine every motion packet read in one drain into a single 6-axis sample."""
+
+    def __init__(self, policy="mean"):
+        self.policy = policy if policy in COALESCING_POLICIES else "mean"
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.elapsed = 0
+        self.period = 0
+        self.sums = [0.0] * 6
+        self.latest = (0, 0, 0, 0, 0, 0)
+
+    def set_policy(self, policy):
+        if policy in COALESCING_POLICIES:
+            self.policy = policy
+
+    def add(self, x, y, z, rx, ry, rz, period):
+        # Weight by device period (ms since the previous packet) so closely spaced bursts don't dominate
+        # The first packet after the puck was at rest reports the whole idle gap; count it as one nominal tick
+        weight = (period if period <= QUIET_MS else REFERENCE_TICK_MS) if period > 0 else 1
+        if period > 0:
+            self.period += weight
+        sums = self.sums
+        sums[0] += x * weight
+        sums[1] += y * weight
+        sums[2] += z * weight
+        sums[3] += rx * weight
+        sums[4] += ry * weight
+        sums[5] += rz * weight
+        self.latest = (x, y, z, rx, ry, rz)
+        self.elapsed += weight
+        self.count += 1
+
+    def take(self):
+        # Returns (sample, packet_count, period_ms) and clears the accumulator, or None if nothing was added.
+        # period_ms is the time the packets cover by their device periods, 0 if the device reported none.
+        # The sample is a velocity; MotionIntegrator turns it into distance using that time.
+        if not self.count:
+            return None
+        if self.policy == "latest":
+            sample = self.latest
+        else:
+            sample = tuple(v / self.elapsed for v in self.sums)
+        result = (sample, self.count, self.period)
+        self.reset()
+        return result
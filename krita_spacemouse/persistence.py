@@ -0,0 +1,60 @@
+# persistence.py
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtCore import QTimer
+from .utils import debug_print, write_settings_file, CONFIG_PATH
+
+SAVE_DEBOUNCE_MS = 500
+
+class SettingsWriter:
+    """Debounces save requests and writes the config atomically on a worker thread."""
+
+    def __init__(self, snapshot, debug_level=lambda: 1, delay_ms=SAVE_DEBOUNCE_MS):
+        self.snapshot = snapshot  # Builds the settings dict; always called on the GUI thread
+        self.debug_level = debug_level
+        self.dirty = False
+        self.last_write = None
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay_ms)
+        self.timer.timeout.connect(self.commit)
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="spacemouse-settings")
+
+    def mark_dirty(self):
+        # Every change restarts the debounce window, so a burst of edits becomes one write
+        self.dirty = True
+        self.timer.start()
+
+    def commit(self):
+        self.timer.stop()
+        self._report_last_write()
+        if not self.dirty:
+            return
+        self.dirty = False
+        # Deep copy so the worker never sees dicts the GUI thread keeps mutating
+        settings = copy.deepcopy(self.snapshot())
+        self.last_write = self.executor.submit(write_settings_file, settings)
+
+    def flush(self):
+        self.commit()
+        if self.last_write:
+            self.last_write.exception()  # Wait for the write to finish
+            self._report_last_write()
+
+    def shutdown(self):
+        self.flush()
+        self.executor.shutdown(wait=True)
+
+    def _report_last_write(self):
+        # Results are logged from the GUI thread; the worker itself never touches Qt
+        write, self.last_write = self.last_write, None
+        if write is None:
+            return
+        if not write.done():
+            self.last_write = write
+            return
+        error = write.exception()
+        if error:
+            debug_print(f"Error saving settings: {error}", 1, debug_level=self.debug_level())
+        else:
+            debug_print("Settings saved to " + CONFIG_PATH, 1, debug_level=self.debug_level())
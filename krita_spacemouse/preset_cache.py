@@ -0,0 +1,81 @@
+# preset_cache.py
+import os
+from collections import OrderedDict
+from PyQt5.QtCore import QFileSystemWatcher, QTimer
+from krita import Krita
+from .utils import debug_print
+
+RECENT_PRESETS = 16  # Length of the recently used preset history
+REBUILD_DELAY_MS = 500  # Bundle imports touch many files; rebuild once they settle
+WARM_DELAY_MS = 2000  # First build runs once Krita is up, not inside the first preset button press
+# Preset and bundle folders only; Krita writes its resource database for unrelated reasons too
+WATCHED_RESOURCES = ("paintoppresets", "bundles")
+
+class PresetCache:
+    """Name-keyed index of Krita's brush presets, built once and rebuilt only after the resources change."""
+
+    def __init__(self, debug_level=lambda: 1):
+        self.debug_level = debug_level
+        self.presets = None  # name -> Resource; None until built
+        self.missed = set()  # Names already looked for since the last rebuild
+        self.recent = OrderedDict()  # Most recently applied last
+        self.rebuild_timer = QTimer()
+        self.rebuild_timer.setSingleShot(True)
+        self.rebuild_timer.timeout.connect(self.rebuild)
+        Krita.instance().notifier().configurationChanged.connect(self.invalidate)
+        self.watcher = QFileSystemWatcher()
+        self.watcher.directoryChanged.connect(self.invalidate)
+        self.watcher.fileChanged.connect(self.invalidate)
+        self.watch_resources()
+
+    def watch_resources(self):
+        location = Krita.instance().getAppDataLocation()
+        paths = [os.path.join(location, name) for name in WATCHED_RESOURCES] if location else []
+        paths = [path for path in paths if os.path.exists(path) and path not in self.watcher.files() + self.watcher.directories()]
+        if paths:
+            self.watcher.addPaths(paths)
+
+    def invalidate(self, *args):
+        self.rebuild_timer.start(REBUILD_DELAY_MS)
+
+    def rebuild(self):
+        self.rebuild_timer.stop()
+        self.presets = Krita.instance().resources("preset")
+        self.missed.clear()
+        self.watch_resources()  # Rewritten files drop out of the watcher, and folders may have been created since
+        debug_print("Preset cache rebuilt with %d presets", 2, debug_level=self.debug_level(), args=(len(self.presets),))
+
+    def warm(self):
+        if self.presets is None:
+            self.rebuild()
+
+    def all(self):
+        if self.presets is None:
+            self.rebuild()
+        return self.presets
+
+    def get(self, name):
+        preset = self.all().get(name)
+        if preset is None and name not in self.missed:
+            # Presets saved from the editor change no watched path; look once more before giving up
+            self.rebuild()
+            self.missed.add(name)
+            preset = self.presets.get(name)
+        return preset
+
+    def touch(self, name):
+        self.recent.pop(name, None)
+        self.recent[name] = True
+        if len(self.recent) > RECENT_PRESETS:
+            self.recent.popitem(last=False)
+
+    def previous(self):
+        # The preset applied before the current one
+        if len(self.recent) < 2:
+            return None
+        names = reversed(self.recent)
+        next(names)
+        return next(names)
+
+    def recent_names(self):
+        return list(reversed(self.recent))
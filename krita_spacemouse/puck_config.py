@@ -0,0 +1,257 @@
+# krita_spacemouse/puck_config.py
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton, QDoubleSpinBox, QSpinBox, QCheckBox, QWidget, QMenu, QStackedWidget
+from .action_menu import ActionMenu
+from .axis_meter import AxisMeter
+from .settings import CANVAS_MOTIONS
+from .utils import debug_print
+
+SPNAV_AXES = ["X", "Y", "Z", "RX", "RY", "RZ"]
+NONE_PAGE, MOTION_PAGE, ACTION_PAGE = range(3)
+
+def sensitivity_spinbox():
+    spinbox = QDoubleSpinBox()
+    spinbox.setRange(0.1, 3.0)
+    spinbox.setSingleStep(0.05)
+    spinbox.setDecimals(2)
+    return spinbox
+
+def dead_zone_spinbox():
+    spinbox = QSpinBox()
+    spinbox.setRange(-130, 370)
+    return spinbox
+
+def set_quietly(widget, setter, value):
+    # Refreshing a control must not echo back into the settings
+    widget.blockSignals(True)
+    setter(value)
+    widget.blockSignals(False)
+
+class AxisControls:
+    """One axis's widgets: a page each for unmapped, canvas motion and Krita action mappings, built once."""
+
+    def __init__(self, dialog, axis):
+        self.dialog = dialog
+        self.axis = axis
+        self.layout = QVBoxLayout()
+        self.layout.setSpacing(5)
+
+        self.label = QLabel(f"{axis} Axis:")
+        self.label.setStyleSheet("font-weight: bold;")
+
+        action_btn = QPushButton("Canvas Motion")
+        action_btn.setToolTip("Select a canvas motion (e.g., Pan, Zoom) or switch to Krita Actions")
+        action_menu = QMenu(action_btn)
+        action_menu.addAction("None").triggered.connect(lambda checked: self.dialog.set_mapping(axis, "None"))
+        canvas_menu = action_menu.addMenu("Canvas Motion")
+        for motion in CANVAS_MOTIONS:
+            canvas_menu.addAction(motion).triggered.connect(lambda checked, m=motion: self.dialog.set_mapping(axis, m))
+        action_btn.setMenu(action_menu)
+        self.mode_btn = QPushButton("Krita Actions")
+        self.mode_btn.setToolTip("Switch to mapping Krita actions (e.g., Undo, Redo) to this axis")
+        self.mode_btn.clicked.connect(lambda checked: self.dialog.toggle_mode(axis))
+
+        self.pages = QStackedWidget()
+        self.pages.addWidget(self.build_none_page())
+        self.pages.addWidget(self.build_motion_page())
+        self.pages.addWidget(self.build_action_page())
+
+        self.layout.addWidget(self.label)
+        self.layout.addWidget(QLabel("Map to:"))
+        self.layout.addWidget(action_btn)
+        self.layout.addWidget(self.mode_btn)
+        self.layout.addWidget(self.pages)
+
+    def build_none_page(self):
+        page = QWidget()
+        grid = QGridLayout(page)
+        self.none_sensitivity = sensitivity_spinbox()
+        self.none_sensitivity.valueChanged.connect(lambda v: self.dialog.set_axis_setting(self.axis, "sensitivity", v))
+        grid.addWidget(QLabel("Sensitivity Factor:"), 0, 0)
+        grid.addWidget(self.none_sensitivity, 0, 1)
+        self.none_dead_zone = dead_zone_spinbox()
+        self.none_dead_zone.valueChanged.connect(lambda v: self.dialog.set_axis_setting(self.axis, "dead_zone_offset", v))
+        grid.addWidget(QLabel("Dead Zone Offset:"), 1, 0)
+        grid.addWidget(self.none_dead_zone, 1, 1)
+        return page
+
+    def build_motion_page(self):
+        page = QWidget()
+        grid = QGridLayout(page)
+        self.motion_sensitivity_label = QLabel("Sensitivity Factor:")
+        self.motion_sensitivity = sensitivity_spinbox()
+        self.motion_sensitivity.valueChanged.connect(lambda v: self.dialog.set_axis_setting(self.full_axis(), "sensitivity", v))
+        grid.addWidget(self.motion_sensitivity_label, 0, 0)
+        grid.addWidget(self.motion_sensitivity, 0, 1)
+        self.motion_dead_zone = dead_zone_spinbox()
+        self.motion_dead_zone.valueChanged.connect(lambda v: self.dialog.set_axis_setting(self.full_axis(), "dead_zone", v))
+        grid.addWidget(QLabel("Dead Zone Offset:"), 1, 0)
+        grid.addWidget(self.motion_dead_zone, 1, 1)
+        self.motion_invert = QCheckBox("Invert")
+        self.motion_invert.setToolTip("Reverses the direction of this motion")
+        self.motion_invert.toggled.connect(lambda checked: self.dialog.set_axis_setting(self.full_axis(), "invert", checked))
+        grid.addWidget(self.motion_invert, 2, 0)
+        return page
+
+    def build_action_page(self):
+        page = QWidget()
+        grid = QGridLayout(page)
+        self.direction_labels = {}
+        for row, direction in enumerate(("negative", "positive")):
+            label = QLabel(f"{direction.capitalize()}: None")
+            button = QPushButton(f"{direction.capitalize()} Action")
+            button.setToolTip(f"Action triggered when pushing this axis in the {direction} direction")
+            menu = ActionMenu(self.dialog.docker.action_catalog, button)
+            menu.action_selected.connect(lambda action, d=direction: self.dialog.set_direction_action(self.axis, d, action))
+            button.setMenu(menu)
+            grid.addWidget(label, row, 0)
+            grid.addWidget(button, row, 1)
+            self.direction_labels[direction] = label
+        self.action_dead_zone = dead_zone_spinbox()
+        self.action_dead_zone.valueChanged.connect(lambda v: self.dialog.set_axis_setting(self.axis, "dead_zone_offset", v))
+        grid.addWidget(QLabel("Dead Zone Offset:"), 2, 0)
+        grid.addWidget(self.action_dead_zone, 2, 1)
+        self.action_sensitivity = sensitivity_spinbox()
+        self.action_sensitivity.valueChanged.connect(lambda v: self.dialog.set_axis_setting(self.axis, "sensitivity", v))
+        grid.addWidget(QLabel("Sensitivity Factor:"), 3, 0)
+        grid.addWidget(self.action_sensitivity, 3, 1)
+        return page
+
+    def mapping(self):
+        return self.dialog.docker.settings.puck_mappings.get(self.axis, "None")
+
+    def full_axis(self):
+        return CANVAS_MOTIONS[self.mapping()][1]
+
+    def refresh(self, global_dead_zone, global_sensitivity):
+        # Show the page for the current mapping and load its values; nothing is rebuilt
+        settings = self.dialog.docker.settings
+        mapping = self.mapping()
+        axis_settings = settings.axis_settings.get(self.axis, {})
+        sensitivity_tip = lambda value: f"Adjust sensitivity relative to global ({global_sensitivity:.2f}); final = {global_sensitivity * value:.2f}"
+        dead_zone_tip = lambda offset: f"Adjust dead zone relative to global ({global_dead_zone}); final = {global_dead_zone + offset}"
+
+        if isinstance(mapping, dict):
+            self.mode_btn.setText("Canvas Motion")
+            self.pages.setCurrentIndex(ACTION_PAGE)
+            for direction, label in self.direction_labels.items():
+                label.setText(f"{direction.capitalize()}: {mapping.get(direction, 'None')}")
+            sensitivity, dead_zone = self.action_sensitivity, self.action_dead_zone
+            sensitivity_value = axis_settings.get("sensitivity", 1.0)
+            offset = axis_settings.get("dead_zone_offset", 0)
+        elif mapping in CANVAS_MOTIONS:
+            self.mode_btn.setText("Krita Actions")
+            self.pages.setCurrentIndex(MOTION_PAGE)
+            canvas_axis, full_axis = CANVAS_MOTIONS[mapping]
+            motion_settings = settings.axis_settings[full_axis]
+            self.motion_sensitivity_label.setText(f"{canvas_axis} Sensitivity Factor:")
+            set_quietly(self.motion_invert, self.motion_invert.setChecked, motion_settings["invert"])
+            sensitivity, dead_zone = self.motion_sensitivity, self.motion_dead_zone
+            sensitivity_value = motion_settings["sensitivity"]
+            offset = motion_settings["dead_zone"] - global_dead_zone
+        else:
+            self.mode_btn.setText("Krita Actions")
+            self.pages.setCurrentIndex(NONE_PAGE)
+            sensitivity, dead_zone = self.none_sensitivity, self.none_dead_zone
+            sensitivity_value = axis_settings.get("sensitivity", 1.0)
+            offset = axis_settings.get("dead_zone_offset", 0)
+
+        set_quietly(sensitivity, sensitivity.setValue, sensitivity_value)
+        set_quietly(dead_zone, dead_zone.setValue, offset)
+        sensitivity.setToolTip(sensitivity_tip(sensitivity_value))
+        dead_zone.setToolTip(dead_zone_tip(offset))
+
+class PuckConfigDialog(QDialog):
+    """Axis mapping dialog, built once per docker and refreshed in place."""
+
+    def __init__(self, docker):
+        super().__init__(docker)
+        self.docker = docker
+        self.setWindowTitle("Configure SpaceMouse Axes")
+        main_layout = QVBoxLayout()
+        main_layout.setSpacing(10)
+
+        self.meter = AxisMeter(self)
+        main_layout.addWidget(self.meter)
+
+        columns_layout = QHBoxLayout()
+        left_column = QVBoxLayout()
+        right_column = QVBoxLayout()
+        self.axes = {}
+        for i, axis in enumerate(SPNAV_AXES):
+            controls = AxisControls(self, axis)
+            self.axes[axis] = controls
+            (left_column if i < 3 else right_column).addLayout(controls.layout)
+        columns_layout.addLayout(left_column)
+        columns_layout.addLayout(right_column)
+        main_layout.addLayout(columns_layout)
+
+        save_btn = QPushButton("Save")
+        save_btn.setToolTip("Save all axis settings and close this dialog")
+        save_btn.clicked.connect(self.save_and_close)
+        main_layout.addWidget(save_btn)
+
+        self.setLayout(main_layout)
+        self.setMinimumWidth(600)
+
+    def globals(self):
+        advanced_tab = getattr(self.docker, 'advanced_tab', None)
+        global_dead_zone = advanced_tab.dead_zone_slider.value() if advanced_tab else 130
+        global_sensitivity = advanced_tab.sensitivity_slider.value() / 333.33 if advanced_tab else 0.3
+        return global_dead_zone, global_sensitivity
+
+    def refresh(self, axes=SPNAV_AXES):
+        global_dead_zone, global_sensitivity = self.globals()
+        for axis in axes:
+            self.axes[axis].refresh(global_dead_zone, global_sensitivity)
+        self.meter.set_dead_zones({entry.axis: entry.dead_zone for entry in self.docker.settings.axis_dispatch})
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()  # Settings may have changed elsewhere since the last open
+        # The meter is fed by the motion pipeline, and only while the dialog is visible
+        extension = getattr(self.docker, 'extension', None)
+        if extension and self.meter.set_values not in extension.motion_listeners:
+            extension.motion_listeners.append(self.meter.set_values)
+            debug_print("Axis meter attached to the motion pipeline", 2, debug_level=self.docker.debug_level_value)
+
+    def hideEvent(self, event):
+        extension = getattr(self.docker, 'extension', None)
+        if extension and self.meter.set_values in extension.motion_listeners:
+            extension.motion_listeners.remove(self.meter.set_values)
+        super().hideEvent(event)
+
+    def set_mapping(self, axis, value):
+        self.docker.settings.update_puck_mapping(axis, value)
+        # Mapping an axis to a motion unbinds that motion from any other axis, so refresh them all
+        self.refresh(SPNAV_AXES if value in CANVAS_MOTIONS else [axis])
+
+    def toggle_mode(self, axis):
+        if isinstance(self.axes[axis].mapping(), dict):
+            self.set_mapping(axis, "None")
+        else:
+            self.set_mapping(axis, {"negative": "None", "positive": "None"})
+
+    def set_direction_action(self, axis, direction, action):
+        mapping = self.docker.settings.puck_mappings.get(axis, {"negative": "None", "positive": "None"})
+        mapping = dict(mapping) if isinstance(mapping, dict) else {"negative": "None", "positive": "None"}
+        mapping[direction] = action
+        self.docker.settings.update_puck_mapping(axis, mapping)
+        self.axes[axis].direction_labels[direction].setText(f"{direction.capitalize()}: {action}")
+
+    def set_axis_setting(self, axis_or_full, key, value):
+        settings = self.docker.settings
+        if key == "dead_zone_offset" and axis_or_full in SPNAV_AXES:
+            settings.axis_settings.setdefault(axis_or_full, {})[key] = value
+        elif key == "dead_zone":  # Motion mode stores absolute value
+            settings.axis_settings[axis_or_full][key] = self.globals()[0] + value
+        else:  # Sensitivity, invert
+            settings.axis_settings.setdefault(axis_or_full, {})[key] = value
+        settings.invalidate_axis_dispatch()
+        settings.save_current_settings()
+        self.meter.set_dead_zones({entry.axis: entry.dead_zone for entry in settings.axis_dispatch})
+
+    def save_and_close(self):
+        # Every control already wrote through to the settings; make sure they reach disk
+        self.docker.settings.invalidate_axis_dispatch()
+        self.docker.settings.save_current_settings()
+        self.accept()
@@ -0,0 +1,132 @@
+# recorder.py
+import mmap
+import os
+import struct
+import time
+from datetime import datetime
+from .spnav import SPNAV_EVENT_ANY, SPNAV_EVENT_MOTION
+
+RECORDING_DIR = os.path.expanduser("~/.local/share/krita/spacenav_recordings")
+RECORDING_MAGIC = b"SPNVREC1"
+# One record per sample: monotonic timestamp (ns), event type, then x, y, z, rx, ry, rz, period
+# for motion or bnum, press for buttons, padded with zeros
+RECORD = struct.Struct("<qi7i")
+
+def recording_path():
+    return os.path.join(RECORDING_DIR, datetime.now().strftime("trace-%Y%m%d-%H%M%S.spnrec"))
+
+class EventRecorder:
+    """Appends the samples poll_spacenav reads to a fixed-record binary trace."""
+
+    def __init__(self, path=None):
+        self.path = path or recording_path()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.file = open(self.path, "wb")
+        self.file.write(RECORDING_MAGIC)
+        self.count = 0
+
+    def write(self, samples):
+        if samples:
+            pack = RECORD.pack
+            self.file.write(b"".join(pack(*sample) for sample in samples))
+            self.count += len(samples)
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+class SpnavReplay:
+    """Replays a trace through the libspnav call surface, in real time or one recorded drain per poll."""
+
+    def __init__(self, path, realtime=True):
+        self.path = path
+        self.realtime = realtime
+        self.file = None
+        self.map = None
+        self.records = ()
+        self.position = 0
+        self.held = []  # Samples spnav_remove_events skipped over but did not remove
+        self.start_ns = 0
+        self.origin_ns = 0
+
+    def spnav_open(self):
+        try:
+            self.file = open(self.path, "rb")
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self.spnav_close()
+            return -1
+        if self.map[:len(RECORDING_MAGIC)] != RECORDING_MAGIC:
+            self.spnav_close()
+            return -1
+        body = memoryview(self.map)[len(RECORDING_MAGIC):]
+        self.records = body[:len(body) - len(body) % RECORD.size]
+        self.position = 0
+        self.origin_ns = self.timestamp(0) if len(self.records) else 0
+        self.start_ns = time.monotonic_ns()
+        return 0
+
+    def spnav_close(self):
+        if isinstance(self.records, memoryview):
+            self.records.release()  # The map cannot close while views of it are exported
+        self.records = ()
+        if self.map:
+            self.map.close()
+            self.map = None
+        if self.file:
+            self.file.close()
+            self.file = None
+        return 0
+
+    def spnav_fd(self):
+        return -1  # Nothing to wait on; callers fall back to timer polling
+
+    @property
+    def finished(self):
+        return self.position >= len(self.records)
+
+    def timestamp(self, offset):
+        return struct.unpack_from("<q", self.records, offset)[0]
+
+    def read_samples(self):
+        held, self.held = self.held, []
+        records = self.records
+        end = self.position
+        if end >= len(records):
+            return held
+        if self.realtime:
+            # Release every sample whose recorded offset has elapsed on our clock
+            deadline = self.origin_ns + time.monotonic_ns() - self.start_ns
+        else:
+            # As fast as possible: one recorded drain (samples sharing a timestamp) per call
+            deadline = self.timestamp(end)
+        while end < len(records) and self.timestamp(end) <= deadline:
+            end += RECORD.size
+        samples = held + list(RECORD.iter_unpack(records[self.position:end]))
+        self.position = end
+        return samples
+
+    def spnav_poll_event(self, event_ref):
+        # Compatibility path; the pipeline prefers read_samples
+        if self.held:
+            sample = self.held.pop(0)
+        elif self.finished:
+            return 0
+        else:
+            sample = RECORD.unpack_from(self.records, self.position)
+            self.position += RECORD.size
+        event = event_ref._obj if hasattr(event_ref, "_obj") else event_ref
+        event.type = sample[1]
+        if sample[1] == SPNAV_EVENT_MOTION:
+            m = event.event.motion
+            m.x, m.y, m.z, m.rx, m.ry, m.rz, m.period = sample[2:9]
+        else:
+            event.event.button.bnum, event.event.button.press = sample[2], sample[3]
+        return event.type
+
+    def spnav_remove_events(self, event_type):
+        # Skip whatever of that type is already due, as the daemon queue would have been flushed
+        samples = self.read_samples()
+        self.held = [sample for sample in samples if event_type != SPNAV_EVENT_ANY and sample[1] != event_type]
+        return len(samples) - len(self.held)
@@ -0,0 +1,99 @@
+# scheduler.py
+import time
+from collections import deque
+from PyQt5.QtCore import QObject, QTimer, Qt, pyqtSignal
+from PyQt5.QtWidgets import QApplication
+from krita import Krita
+from .utils import debug_print
+
+ACTIVE_INTERVAL_MS = 3  # While the puck or a button is in use
+DEFAULT_IDLE_TIMEOUT_MS = 1000
+JITTER_WINDOW = 256  # Tick intervals kept for the jitter statistics
+RATE_WINDOW = 32  # The most recent of those give the current effective rate
+
+class AdaptiveScheduler(QObject):
+    """Polls fast while the puck is in use, slows to the idle rate when it rests, and stops while Krita can't use input."""
+    suspended_changed = pyqtSignal(bool)
+
+    def __init__(self, poll, idle_interval=10, idle_timeout=DEFAULT_IDLE_TIMEOUT_MS, debug_level=lambda: 1):
+        super().__init__()
+        self.poll = poll
+        self.idle_interval = idle_interval
+        self.idle_timeout = idle_timeout
+        self.debug_level = debug_level
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.tick)
+        self.interval = idle_interval
+        self.last_activity_ns = 0
+        self.last_tick_ns = None
+        self.intervals = deque(maxlen=JITTER_WINDOW)  # (expected_ms, actual_ms)
+        self.suspended = False
+        QApplication.instance().applicationStateChanged.connect(self.check_suspended)
+        notifier = Krita.instance().notifier()
+        for signal in (notifier.imageCreated, notifier.imageClosed, notifier.viewCreated, notifier.viewClosed, notifier.windowCreated):
+            signal.connect(self.schedule_check)
+
+    def start(self, idle_interval=None):
+        if idle_interval is not None:
+            self.idle_interval = idle_interval
+        self.set_interval(self.idle_interval)
+
+    def stop(self):
+        self.timer.stop()
+        self.last_tick_ns = None
+
+    def is_active(self):
+        return self.timer.isActive()
+
+    def set_interval(self, interval):
+        self.interval = interval
+        self.last_tick_ns = None  # Don't count the switch itself as jitter
+        self.timer.start(interval)
+
+    def set_idle_interval(self, interval):
+        self.idle_interval = interval
+        if self.timer.isActive() and self.interval != ACTIVE_INTERVAL_MS:
+            self.set_interval(interval)
+
+    def activity(self):
+        # Called by poll_spacenav whenever it read an event; works for every input mode
+        self.last_activity_ns = time.monotonic_ns()
+        if self.timer.isActive() and self.interval != ACTIVE_INTERVAL_MS:
+            self.set_interval(ACTIVE_INTERVAL_MS)
+            debug_print("Polling ramped up to %dms", 3, debug_level=self.debug_level(), args=(ACTIVE_INTERVAL_MS,))
+
+    def tick(self):
+        now = time.monotonic_ns()
+        if self.last_tick_ns is not None:
+            self.intervals.append((self.interval, (now - self.last_tick_ns) / 1e6))
+        self.last_tick_ns = now
+        if self.interval == ACTIVE_INTERVAL_MS and (now - self.last_activity_ns) / 1e6 >= self.idle_timeout:
+            self.set_interval(self.idle_interval)
+            debug_print("Polling decayed to idle %dms", 3, debug_level=self.debug_level(), args=(self.idle_interval,))
+        self.poll()
+
+    def schedule_check(self, *args):
+        # Document and view signals fire before Krita updates its lists, so look once the event loop settles
+        QTimer.singleShot(0, self.check_suspended)
+
+    def check_suspended(self, *args):
+        app = Krita.instance()
+        suspended = QApplication.applicationState() != Qt.ApplicationActive or not app.documents()
+        if suspended != self.suspended:
+            self.suspended = suspended
+            debug_print(f"Input {'suspended' if suspended else 'resumed'}", 2, debug_level=self.debug_level())
+            self.suspended_changed.emit(suspended)
+
+    def stats(self):
+        # Effective rate and timer jitter (|actual - expected| interval) over the recent window
+        if not self.intervals:
+            return None
+        recent = [a for _, a in self.intervals][-RATE_WINDOW:]
+        jitter = [abs(a - e) for e, a in self.intervals]
+        mean_interval = sum(recent) / len(recent)
+        return {
+            "rate_hz": 1000.0 / mean_interval if mean_interval > 0 else 0.0,
+            "jitter_mean_ms": sum(jitter) / len(jitter),
+            "jitter_max_ms": max(jitter),
+        }
@@ -1,13 +1,34 @@
 # settings.py
 from PyQt5.QtWidgets import QDoubleSpinBox, QSpinBox, QCheckBox, QComboBox, QInputDialog
-from PyQt5.QtCore import Qt, QPointF
-from .utils import debug_print, load_settings, save_settings
+from PyQt5.QtCore import Qt, QPointF, QTimer
+from collections import namedtuple
+from .utils import debug_print, load_settings
+from .persistence import SettingsWriter
+from .action_index import ActionIndex
+from .preset_cache import PresetCache, WARM_DELAY_MS
+
+MAX_INPUT = 500
+CURVE_AXES = ["X", "Y", "Zoom", "Rotation"]
+LINEAR_CURVE = [[0.0, 0.0], [0.25, 0.25], [0.75, 0.75], [1.0, 1.0]]
+SN_AXIS_INDEX = {"X": 0, "Y": 1, "Z": 2, "RX": 3, "RY": 4, "RZ": 5}
+# Puck mapping value -> (curve editor key, axis_settings key)
+CANVAS_MOTIONS = {
+    "Pan X (Panning Horizontal)": ("X", "X (Panning Horizontal)"),
+    "Pan Y (Panning Vertical)": ("Y", "Y (Panning Vertical)"),
+    "Zoom": ("Zoom", "Zoom"),
+    "Rotation": ("Rotation", "Rotation")
+}
+
+# One precompiled entry per mapped SpaceMouse axis. Canvas entries use target/dead_zone/inv_range/scale/curve (a CurveBank row),
+# Krita action entries (target "action") use dead_zone/negative/positive.
+AxisDispatch = namedtuple("AxisDispatch", ["axis", "index", "target", "dead_zone", "inv_range", "scale", "curve", "negative", "positive"])
 
 class SettingsManager:
     def __init__(self, parent, load=True):
         debug_print("Starting SettingsManager __init__", 1, debug_level=1)
         self.parent = parent
         self.button_mappings = {}
+        self.button_mappings_version = 0  # Bumped on every change so the button dispatcher recompiles its table
         self.button_presets = {
             "Default": {
                 "0": {"None": "edit_undo"}, "1": {"None": "edit_redo"}, "2": {"None": "view_zoom_in"}, "3": {"None": "view_zoom_out"},
@@ -31,6 +52,14 @@ class SettingsManager:
             "RZ": "Pan X (Panning Horizontal)"
         }
         self.axis_settings = {}
+        self._axis_dispatch = None
+        self.curve_points = {axis: LINEAR_CURVE for axis in CURVE_AXES}  # Source of truth until the curves tab is built
+        self.custom_curve_presets = {}
+        self._curve_bank = None
+        self.writer = SettingsWriter(self.build_settings, lambda: getattr(self.parent, 'debug_level_value', 1))
+        self.preset_cache = PresetCache(lambda: getattr(self.parent, 'debug_level_value', 1))
+        QTimer.singleShot(WARM_DELAY_MS, self.preset_cache.warm)
+        self.action_index = ActionIndex(self.mapped_action_names, lambda: getattr(self.parent, 'debug_level_value', 1))
         self.sn_axes = ["X", "Y", "Z", "RX", "RY", "RZ"]
         self.default_mappings = {"X": "RZ", "Y": "RX", "Zoom": "Y", "Rotation": "RY"}
 
@@ -84,6 +113,17 @@ class SettingsManager:
                     polling_interval = settings.get("polling_interval", 10)
                     self.parent.advanced_tab.polling_slider.setValue(polling_interval)
                     self.parent.advanced_tab.polling_label.setText(f"Polling Rate: {polling_interval}ms ({1000/polling_interval:.1f}Hz)")
+                    input_mode_index = self.parent.advanced_tab.input_mode.findData(settings.get("input_mode", "notifier"))
+                    self.parent.advanced_tab.input_mode.setCurrentIndex(max(input_mode_index, 0))
+                    coalescing_index = self.parent.advanced_tab.coalescing_policy.findData(settings.get("motion_coalescing", "mean"))
+                    if coalescing_index != -1:
+                        self.parent.advanced_tab.coalescing_policy.setCurrentIndex(coalescing_index)
+                    zoom_anchor_index = self.parent.advanced_tab.zoom_anchor.findData(settings.get("zoom_anchor", "center"))
+                    if zoom_anchor_index != -1:
+                        self.parent.advanced_tab.zoom_anchor.setCurrentIndex(zoom_anchor_index)
+                    backend_index = self.parent.advanced_tab.spnav_backend.findData(settings.get("spnav_backend", "auto"))
+                    if backend_index != -1:
+                        self.parent.advanced_tab.spnav_backend.setCurrentIndex(backend_index)
                     global_dead_zone = settings.get("global_dead_zone", 130)
                     self.parent.advanced_tab.dead_zone_slider.setValue(global_dead_zone)
                     self.parent.advanced_tab.dead_zone_label.setText(f"Global Dead Zone: {global_dead_zone}")
@@ -93,12 +133,20 @@ class SettingsManager:
                     long_press_duration = settings.get("long_press_duration", 500)
                     self.parent.advanced_tab.long_press_slider.setValue(long_press_duration)
                     self.parent.advanced_tab.long_press_label.setText(f"Long Press Duration: {long_press_duration}ms")
+                    idle_timeout = settings.get("idle_timeout", 1000)
+                    self.parent.advanced_tab.idle_timeout_slider.setValue(idle_timeout)
+                    self.parent.advanced_tab.idle_timeout_label.setText(f"Idle After: {idle_timeout}ms")
                 else:
                     self.parent.debug_level_value = settings.get("debug_level", 1)
                     self.parent.polling_interval = settings.get("polling_interval", 10)
+                    self.parent.input_mode = settings.get("input_mode", "notifier")
+                    self.parent.motion_coalescing = settings.get("motion_coalescing", "mean")
+                    self.parent.zoom_anchor = settings.get("zoom_anchor", "center")
+                    self.parent.backend = settings.get("spnav_backend", "auto")
                     self.parent.global_dead_zone = settings.get("global_dead_zone", 130)
                     self.parent.global_sensitivity = settings.get("global_sensitivity", 100)
                     self.parent.long_press_duration = settings.get("long_press_duration", 500)
+                    self.parent.idle_timeout = settings.get("idle_timeout", 1000)
 
                 loaded_mappings = settings.get("button_mappings", self.button_presets["Default"].copy())
                 self.button_mappings = {}
@@ -117,6 +165,7 @@ class SettingsManager:
                     else:
                         debug_print(f"Unexpected mapping format for button {btn_id}: {mapping}", 1, debug_level=1)
                         self.button_mappings[btn_id] = {"None": "None"}
+                self.invalidate_button_dispatch()
 
                 self.button_presets = settings.get("button_presets", self.button_presets)
                 loaded_puck_mappings = settings.get("puck_mappings", self.puck_mappings)
@@ -129,10 +178,13 @@ class SettingsManager:
                     else:
                         self.puck_mappings[axis] = "None"
 
+                for axis in ["x", "y", "zoom", "rotation"]:
+                    self.set_curve_points(axis.capitalize(), settings.get(f"{axis}_curve", LINEAR_CURVE))
+                self.custom_curve_presets = settings.get("custom_presets", {})
                 if hasattr(self.parent, 'curves_tab'):
                     for axis in ["x", "y", "zoom", "rotation"]:
                         debug_print(f"Loading curve for {axis}", 2, debug_level=self.parent.debug_level_value)
-                        curve_points = settings.get(f"{axis}_curve", [[0.0, 0.0], [0.25, 0.25], [0.75, 0.75], [1.0, 1.0]])
+                        curve_points = settings.get(f"{axis}_curve", LINEAR_CURVE)
                         debug_print(f"Loaded curve points for {axis}: {curve_points}", 2, debug_level=self.parent.debug_level_value)
                         editor = self.parent.curves_tab.curve_editors[axis.capitalize()]
                         for i, (x, y) in enumerate(curve_points):
@@ -140,7 +192,7 @@ class SettingsManager:
                             debug_print(f"Set {axis} point {i}: ({x}, {y})", 3, debug_level=self.parent.debug_level_value)
                         editor.update_curve()
                         debug_print(f"Updated curve for {axis}", 2, debug_level=self.parent.debug_level_value)
-                    self.parent.curves_tab.custom_presets = settings.get("custom_presets", {})
+                    self.parent.curves_tab.custom_presets = self.custom_curve_presets
                     self.parent.curves_tab.preset_selector.addItems(self.parent.curves_tab.custom_presets.keys())
 
                 debug_print("Settings applied successfully", 1, debug_level=1)
@@ -150,6 +202,7 @@ class SettingsManager:
         else:
             debug_print("No settings file, applying defaults", 1, debug_level=1)
             self.button_mappings = self.button_presets["Default"].copy()
+            self.invalidate_button_dispatch()
             if hasattr(self.parent, 'advanced_tab'):
                 self.parent.debug_level_value = 1
                 self.parent.advanced_tab.debug_level.setCurrentIndex(1)
@@ -159,27 +212,45 @@ class SettingsManager:
             else:
                 self.parent.debug_level_value = 1
         self.load_button_preset("Default")
+        self.invalidate_axis_dispatch()
         debug_print("load_settings completed", 1, debug_level=1)
 
     def save_current_settings(self):
-        debug_print("Saving current settings", 1, debug_level=getattr(self.parent, 'debug_level_value', 1))
+        # Debounced: the config is written off the GUI thread once changes settle; see flush_settings()
+        debug_print("Settings changed, write scheduled", 2, debug_level=getattr(self.parent, 'debug_level_value', 1))
+        self.writer.mark_dirty()
+
+    def flush_settings(self):
+        self.writer.flush()
+
+    def build_settings(self):
         settings = {
             "button_mappings": self.button_mappings,
             "button_presets": self.button_presets,
-            "custom_presets": self.parent.curves_tab.custom_presets if hasattr(self.parent, 'curves_tab') else {},
+            "custom_presets": self.parent.curves_tab.custom_presets if hasattr(self.parent, 'curves_tab') else self.custom_curve_presets,
             "puck_mappings": self.puck_mappings,
             "long_press_duration": self.parent.advanced_tab.long_press_slider.value() if hasattr(self.parent, 'advanced_tab') else getattr(self.parent, 'long_press_duration', 500)
         }
         if hasattr(self.parent, 'advanced_tab'):
             settings["debug_level"] = self.parent.advanced_tab.debug_level.currentIndex()
             settings["polling_interval"] = self.parent.advanced_tab.polling_slider.value()
+            settings["input_mode"] = self.parent.advanced_tab.input_mode.currentData()
+            settings["motion_coalescing"] = self.parent.advanced_tab.coalescing_policy.currentData()
+            settings["zoom_anchor"] = self.parent.advanced_tab.zoom_anchor.currentData()
+            settings["spnav_backend"] = self.parent.advanced_tab.spnav_backend.currentData()
             settings["global_dead_zone"] = self.parent.advanced_tab.dead_zone_slider.value()
             settings["global_sensitivity"] = self.parent.advanced_tab.sensitivity_slider.value()
+            settings["idle_timeout"] = self.parent.advanced_tab.idle_timeout_slider.value()
         else:
             settings["debug_level"] = getattr(self.parent, 'debug_level_value', 1)
             settings["polling_interval"] = getattr(self.parent, 'polling_interval', 10)
+            settings["input_mode"] = getattr(self.parent, 'input_mode', "notifier")
+            settings["motion_coalescing"] = getattr(self.parent, 'motion_coalescing', "mean")
+            settings["zoom_anchor"] = getattr(self.parent, 'zoom_anchor', "center")
+            settings["spnav_backend"] = getattr(self.parent, 'backend', "auto")
             settings["global_dead_zone"] = getattr(self.parent, 'global_dead_zone', 130)
             settings["global_sensitivity"] = getattr(self.parent, 'global_sensitivity', 100)
+            settings["idle_timeout"] = getattr(self.parent, 'idle_timeout', 1000)
 
         for canvas_axis in ["X (Panning Horizontal)", "Y (Panning Vertical)", "Zoom", "Rotation"]:
             axis_key = canvas_axis.split()[0].lower()
@@ -188,7 +259,7 @@ class SettingsManager:
             settings[f"{axis_key}_binding"] = self.axis_settings[canvas_axis]["binding"]
             settings[f"{axis_key}_dead_zone"] = self.axis_settings[canvas_axis]["dead_zone"]
             editor = self.parent.curves_tab.curve_editors[canvas_axis.split()[0]] if hasattr(self.parent, 'curves_tab') else None
-            settings[f"{axis_key}_curve"] = [[p.x(), p.y()] for p in editor.control_points] if editor else [[0.0, 0.0], [0.25, 0.25], [0.75, 0.75], [1.0, 1.0]]
+            settings[f"{axis_key}_curve"] = [[p.x(), p.y()] for p in editor.control_points] if editor else self.curve_points[canvas_axis.split()[0]]
 
         for axis in self.sn_axes:
             if axis in self.axis_settings:
@@ -196,16 +267,15 @@ class SettingsManager:
                     settings[f"{axis.lower()}_dead_zone_offset"] = self.axis_settings[axis]["dead_zone_offset"]
                 if "sensitivity" in self.axis_settings[axis]:
                     settings[f"{axis.lower()}_sensitivity"] = self.axis_settings[axis]["sensitivity"]
-        save_settings(settings)
-        debug_print("Settings saved", 1, debug_level=getattr(self.parent, 'debug_level_value', 1))
+        return settings
 
     def update_button_mapping(self, button_id, action, modifier="None"):
         button_id = str(button_id)
         if button_id not in self.button_mappings or not isinstance(self.button_mappings[button_id], dict):
             self.button_mappings[button_id] = {"None": "None"}
-        index = self.parent.buttons_tab.available_actions.index(action) if action in self.parent.buttons_tab.available_actions else -1
-        if index != -1 or action.startswith("BrushPreset:"):
+        if action == "None" or self.parent.action_catalog.contains(action) or action.startswith("BrushPreset:"):
             self.button_mappings[button_id][modifier] = action
+            self.invalidate_button_dispatch()
             debug_print(f"Button {button_id} mapped to {modifier}+{action}", 1, debug_level=getattr(self.parent, 'debug_level_value', 1))
         self.save_current_settings()
 
@@ -216,13 +286,8 @@ class SettingsManager:
                 for canvas_axis in ["X (Panning Horizontal)", "Y (Panning Vertical)", "Zoom", "Rotation"]:
                     if self.axis_settings[canvas_axis]["binding"] == axis:
                         self.axis_settings[canvas_axis]["binding"] = "None"
-            elif value in ["Pan X (Panning Horizontal)", "Pan Y (Panning Vertical)", "Zoom", "Rotation"]:
-                canvas_axis = value.split()[0]
-                if canvas_axis == "Pan" and "Horizontal" in value:
-                    canvas_axis = "X"
-                elif canvas_axis == "Pan" and "Vertical" in value:
-                    canvas_axis = "Y"
-                full_axis = f"{canvas_axis} (Panning Horizontal)" if canvas_axis == "X" else f"{canvas_axis} (Panning Vertical)" if canvas_axis == "Y" else canvas_axis
+            elif value in CANVAS_MOTIONS:
+                full_axis = CANVAS_MOTIONS[value][1]
                 if full_axis in self.axis_settings:
                     for ca in self.axis_settings:
                         if ca != full_axis and self.axis_settings[ca]["binding"] == axis:
@@ -234,8 +299,88 @@ class SettingsManager:
             debug_print(f"Invalid puck mapping value for {axis}: {value}", 1, debug_level=getattr(self.parent, 'debug_level_value', 1))
             self.puck_mappings[axis] = "None"
         debug_print(f"Puck {axis} updated to {value}", 1, debug_level=getattr(self.parent, 'debug_level_value', 1))
+        self.invalidate_axis_dispatch()
         self.save_current_settings()
 
+    @property
+    def curve_bank(self):
+        # Created on first use so numpy is only imported once curves are actually evaluated or drawn
+        if self._curve_bank is None:
+            from .curve_lut import CurveBank
+            self._curve_bank = CurveBank(CURVE_AXES)
+            for axis, points in self.curve_points.items():
+                self._curve_bank.bake(axis, points)
+        return self._curve_bank
+
+    def set_curve_points(self, axis, points):
+        self.curve_points[axis] = points
+        if self._curve_bank is not None:
+            self._curve_bank.bake(axis, points)
+
+    def invalidate_axis_dispatch(self):
+        # Call whenever puck_mappings, axis_settings or the global dead zone/sensitivity change
+        self._axis_dispatch = None
+        self.action_index.invalidate()
+
+    def invalidate_button_dispatch(self):
+        # Call whenever button_mappings change
+        self.button_mappings_version += 1
+        self.action_index.invalidate()
+
+    def mapped_action_names(self):
+        # Every action name a button or puck axis can trigger, for the action index
+        for mapping in self.button_mappings.values():
+            if isinstance(mapping, dict):
+                yield from mapping.values()
+            elif isinstance(mapping, str):
+                yield mapping
+        for mapping in self.puck_mappings.values():
+            if isinstance(mapping, dict):
+                yield mapping.get("negative", "None")
+                yield mapping.get("positive", "None")
+
+    @property
+    def axis_dispatch(self):
+        if self._axis_dispatch is None:
+            self._axis_dispatch = self.compile_axis_dispatch()
+        return self._axis_dispatch
+
+    def compile_axis_dispatch(self):
+        debug_level = getattr(self.parent, 'debug_level_value', 1)
+        advanced_tab = getattr(self.parent, 'advanced_tab', None)
+        global_dead_zone = advanced_tab.dead_zone_slider.value() if advanced_tab else getattr(self.parent, 'global_dead_zone', 130)
+        # Rescale sensitivity: 0-100% maps to 0-0.3 (30% from last version = 100% now)
+        global_sensitivity_raw = advanced_tab.sensitivity_slider.value() if advanced_tab else getattr(self.parent, 'global_sensitivity', 100)
+        global_sensitivity = global_sensitivity_raw / 333.33  # 100% = 0.3 effective
+
+        table = []
+        for sm_axis in self.sn_axes:
+            action = self.puck_mappings.get(sm_axis, "None")
+            if action == "None":
+                continue
+            if isinstance(action, str) and action in CANVAS_MOTIONS:
+                target, full_axis = CANVAS_MOTIONS[action]
+                settings = self.axis_settings.get(full_axis)
+                if settings is None:
+                    debug_print(f"Axis {full_axis} not in axis_settings", 1, debug_level=debug_level)
+                    continue
+                dead_zone = settings["dead_zone"]
+                if dead_zone >= MAX_INPUT:
+                    debug_print(f"Dead zone {dead_zone} for {full_axis} covers the whole input range, skipping {sm_axis}", 1, debug_level=debug_level)
+                    continue
+                sign = -1 if settings["invert"] else 1
+                table.append(AxisDispatch(sm_axis, SN_AXIS_INDEX[sm_axis], target, dead_zone, 1.0 / (MAX_INPUT - dead_zone),
+                                          MAX_INPUT * global_sensitivity * settings["sensitivity"] * sign,
+                                          self.curve_bank.rows[target], None, None))
+            elif isinstance(action, dict) and "negative" in action and "positive" in action:
+                dead_zone = global_dead_zone + self.axis_settings.get(sm_axis, {}).get("dead_zone_offset", 0)
+                table.append(AxisDispatch(sm_axis, SN_AXIS_INDEX[sm_axis], "action", dead_zone, 0.0, 0.0, None,
+                                          action["negative"], action["positive"]))
+            else:
+                debug_print(f"Invalid puck mapping for {sm_axis}: {action}", 1, debug_level=debug_level)
+        debug_print(f"Compiled axis dispatch table with {len(table)} entries", 2, debug_level=debug_level)
+        return tuple(table)
+
     def save_button_preset(self):
         name, ok = QInputDialog.getText(self.parent, "Save Preset", "Preset Name:")
         if ok and name:
@@ -266,4 +411,5 @@ class SettingsManager:
     def load_button_preset(self, name):
         if name in self.button_presets:
             self.button_mappings = self.button_presets[name].copy()
+            self.invalidate_button_dispatch()
             debug_print(f"Loaded button preset: {name}", 1, debug_level=getattr(self.parent, 'debug_level_value', 1))
@@ -1,14 +1,14 @@
 import ctypes
 from .utils import debug_print  # Import debug_print for error logging
 
-try:
-    libspnav = ctypes.CDLL("libspnav.so.0")
-    debug_print("libspnav loaded successfully", 1, debug_level=1)
-except OSError as e:
-    debug_print(f"Error: Could not load libspnav.so.0 - {e}", 1, debug_level=1)
-    raise
+# Loaded on first use by load_libspnav(); None until then, and after a failed load
+libspnav = None
+_libspnav_loaded = False
+
+SPNAV_BACKENDS = ("auto", "libspnav", "socket")
 
 # Event type constants
+SPNAV_EVENT_ANY = 0
 SPNAV_EVENT_MOTION = 1
 SPNAV_EVENT_BUTTON = 2
 
@@ -37,12 +37,37 @@ class SpnavEventWrapper(ctypes.Structure):
         ("event", SpnavEvent)
     ]
 
-# Configure function signatures
-libspnav.spnav_poll_event.argtypes = [ctypes.POINTER(SpnavEventWrapper)]
-libspnav.spnav_poll_event.restype = ctypes.c_int
-libspnav.spnav_remove_events.argtypes = [ctypes.c_int]
-libspnav.spnav_remove_events.restype = ctypes.c_int
-libspnav.spnav_open.argtypes = []
-libspnav.spnav_open.restype = ctypes.c_int
-libspnav.spnav_close.argtypes = []
-libspnav.spnav_close.restype = ctypes.c_int
+def load_libspnav():
+    global libspnav, _libspnav_loaded
+    if _libspnav_loaded:
+        return libspnav
+    _libspnav_loaded = True
+    try:
+        library = ctypes.CDLL("libspnav.so.0")
+    except OSError as e:
+        # Not fatal: the socket backend talks to spacenavd without the C library
+        debug_print(f"Could not load libspnav.so.0 - {e}", 1, debug_level=1)
+        return None
+    debug_print("libspnav loaded successfully", 1, debug_level=1)
+    # Configure function signatures
+    library.spnav_poll_event.argtypes = [ctypes.POINTER(SpnavEventWrapper)]
+    library.spnav_poll_event.restype = ctypes.c_int
+    library.spnav_remove_events.argtypes = [ctypes.c_int]
+    library.spnav_remove_events.restype = ctypes.c_int
+    library.spnav_open.argtypes = []
+    library.spnav_open.restype = ctypes.c_int
+    library.spnav_close.argtypes = []
+    library.spnav_close.restype = ctypes.c_int
+    library.spnav_fd.argtypes = []
+    library.spnav_fd.restype = ctypes.c_int
+    libspnav = library
+    return libspnav
+
+def select_backend(name="auto", socket_path=None):
+    # Returns an object with the libspnav call surface, or None if the requested backend is unavailable
+    if name in ("libspnav", "auto"):
+        library = load_libspnav()
+        if library or name == "libspnav":
+            return library
+    from .spnav_socket import SpnavSocket
+    return SpnavSocket(socket_path)
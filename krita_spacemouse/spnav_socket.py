@@ -0,0 +1,125 @@
+# spnav_socket.py
+import os
+import socket
+import struct
+import time
+from collections import deque
+from .spnav import SPNAV_EVENT_ANY, SPNAV_EVENT_MOTION, SPNAV_EVENT_BUTTON
+
+# spacenavd's legacy (v0) protocol: every event is eight native ints.
+# data[0] is 0 for motion (x, y, z, rx, ry, rz, period in data[1..7]),
+# 1 for a button press and 2 for a release (button number in data[1]).
+PACKET = struct.Struct("=8i")
+PACKET_SIZE = PACKET.size
+BATCH_PACKETS = 256  # Packets pulled per recv_into
+
+SOCKET_PATHS = [
+    "/var/run/spnav.sock",          # Arch Linux default
+    "/tmp/.spnav.sock",             # Common on other distros
+    os.path.join(os.environ.get("XDG_RUNTIME_DIR", "/tmp"), "spnav.sock"),  # XDG fallback
+    os.environ.get("SPNAV_SOCKPATH")  # Custom env var, if set
+]
+
+def find_socket_path():
+    for path in SOCKET_PATHS:
+        if path and os.path.exists(path):
+            return path
+    return None
+
+class SpnavSocket:
+    """Talks to spacenavd over its AF_UNIX socket; mirrors the libspnav calls the plugin uses."""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.sock = None
+        self.buffer = bytearray(PACKET_SIZE * BATCH_PACKETS)
+        self.view = memoryview(self.buffer)
+        self.partial = 0  # Bytes of an incomplete packet kept at the start of the buffer
+        self.pending = deque()
+
+    def spnav_open(self):
+        path = self.path or find_socket_path()
+        if not path:
+            return -1
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(path)
+        except OSError:
+            sock.close()
+            return -1
+        sock.setblocking(False)
+        self.path = path
+        self.sock = sock
+        return 0
+
+    def spnav_close(self):
+        if self.sock:
+            self.sock.close()
+            self.sock = None
+        self.pending.clear()
+        self.partial = 0
+        return 0
+
+    def spnav_fd(self):
+        return self.sock.fileno() if self.sock else -1
+
+    def fill(self):
+        # Read everything the daemon has queued, decoding whole packets in bulk
+        if not self.sock:
+            return
+        while True:
+            try:
+                received = self.sock.recv_into(self.view[self.partial:])
+            except (BlockingIOError, InterruptedError):
+                return
+            if received == 0:
+                self.spnav_close()
+                raise ConnectionResetError("spacenavd closed the connection")
+            available = self.partial + received
+            complete = available - available % PACKET_SIZE
+            now = time.monotonic_ns()
+            pending = self.pending
+            for data in PACKET.iter_unpack(self.view[:complete]):
+                if data[0] == 0:
+                    pending.append((now, SPNAV_EVENT_MOTION) + data[1:8])
+                else:
+                    pending.append((now, SPNAV_EVENT_BUTTON, data[1], 1 if data[0] == 1 else 0, 0, 0, 0, 0, 0))
+            self.partial = available - complete
+            if self.partial:
+                self.buffer[:self.partial] = self.buffer[complete:available]
+            if available < len(self.buffer):
+                return  # The socket is drained
+
+    def read_samples(self):
+        # Batched path used by poll_spacenav and the reader thread instead of one spnav_poll_event per event
+        self.fill()
+        pending = self.pending
+        samples = list(pending)
+        pending.clear()
+        return samples
+
+    def spnav_poll_event(self, event_ref):
+        if not self.pending:
+            self.fill()
+            if not self.pending:
+                return 0
+        sample = self.pending.popleft()
+        event = event_ref._obj if hasattr(event_ref, "_obj") else event_ref
+        event.type = sample[1]
+        if sample[1] == SPNAV_EVENT_MOTION:
+            m = event.event.motion
+            m.x, m.y, m.z, m.rx, m.ry, m.rz, m.period = sample[2:9]
+        else:
+            event.event.button.bnum, event.event.button.press = sample[2], sample[3]
+        return event.type
+
+    def spnav_remove_events(self, event_type):
+        self.fill()
+        if event_type == SPNAV_EVENT_ANY:
+            removed = len(self.pending)
+            self.pending.clear()
+            return removed
+        kept = deque(sample for sample in self.pending if sample[1] != event_type)
+        removed = len(self.pending) - len(kept)
+        self.pending = kept
+        return removed
@@ -1,7 +1,8 @@
 # tabs/advanced_tab.py
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QComboBox, QLabel, QSlider, QPushButton
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from ..utils import debug_print
+from ..scheduler import ACTIVE_INTERVAL_MS
 
 class AdvancedTab(QWidget):
     def __init__(self, parent):
@@ -16,8 +17,57 @@ class AdvancedTab(QWidget):
         self.layout.addWidget(QLabel("Debug Logging Level:"))
         self.layout.addWidget(self.debug_level)
 
+        self.input_mode = QComboBox()
+        self.input_mode.setToolTip("Event-driven input only wakes up when the SpaceMouse sends data; timer polling checks at a fixed rate;\n"
+                                   "the reader thread keeps collecting input while Krita is busy and applies it once per frame")
+        self.input_mode.addItem("Event-driven", "notifier")
+        self.input_mode.addItem("Timer Polling", "timer")
+        self.input_mode.addItem("Reader Thread", "thread")
+        self.input_mode.currentIndexChanged.connect(self.parent.update_input_mode)
+        self.layout.addWidget(QLabel("Input Mode:"))
+        self.layout.addWidget(self.input_mode)
+
+        self.coalescing_policy = QComboBox()
+        self.coalescing_policy.setToolTip("How motion packets that arrive together are combined into one canvas update:\n"
+                                          "Latest Wins uses the newest packet, Mean averages them over time.\n"
+                                          "Either way the motion is scaled by the time the packets cover, so speed does not depend on the polling rate")
+        self.coalescing_policy.addItem("Latest Wins", "latest")
+        self.coalescing_policy.addItem("Mean", "mean")
+        self.coalescing_policy.setCurrentIndex(self.coalescing_policy.findData("mean"))
+        self.coalescing_policy.currentIndexChanged.connect(self.parent.update_coalescing_policy)
+        self.layout.addWidget(QLabel("Motion Coalescing:"))
+        self.layout.addWidget(self.coalescing_policy)
+
+        self.zoom_anchor = QComboBox()
+        self.zoom_anchor.setToolTip("Point that stays fixed while zooming with the puck")
+        self.zoom_anchor.addItem("View Center", "center")
+        self.zoom_anchor.addItem("Cursor", "cursor")
+        self.zoom_anchor.currentIndexChanged.connect(self.parent.update_zoom_anchor)
+        self.layout.addWidget(QLabel("Zoom Anchor:"))
+        self.layout.addWidget(self.zoom_anchor)
+
+        self.spnav_backend = QComboBox()
+        self.spnav_backend.setToolTip("How the plugin talks to spacenavd: libspnav uses the C library,\n"
+                                      "Socket reads the daemon's socket directly, Automatic prefers libspnav when it is installed")
+        self.spnav_backend.addItem("Automatic", "auto")
+        self.spnav_backend.addItem("libspnav", "libspnav")
+        self.spnav_backend.addItem("Socket", "socket")
+        self.spnav_backend.currentIndexChanged.connect(self.parent.update_spnav_backend)
+        self.layout.addWidget(QLabel("Backend:"))
+        self.layout.addWidget(self.spnav_backend)
+
+        self.record_button = QPushButton("Record")
+        self.record_button.setToolTip("Record the raw SpaceMouse event stream to a trace file for offline replay")
+        self.record_button.setCheckable(True)
+        self.record_button.toggled.connect(self.parent.toggle_recording)
+        self.record_label = QLabel("Not recording")
+        self.record_label.setWordWrap(True)
+        self.layout.addWidget(self.record_button)
+        self.layout.addWidget(self.record_label)
+
         self.polling_slider = QSlider(Qt.Horizontal)
-        self.polling_slider.setToolTip("Adjust how often the SpaceMouse is checked (lower = faster, higher = less CPU)")
+        self.polling_slider.setToolTip("How often the SpaceMouse is checked in timer polling mode while the puck is at rest (lower = faster, higher = less CPU).\n"
+                                       "Any motion or button press switches to fast polling until the puck has been idle for the Idle After time")
         self.polling_slider.setMinimum(1)
         self.polling_slider.setMaximum(100)
         self.polling_slider.setValue(10)
@@ -26,6 +76,24 @@ class AdvancedTab(QWidget):
         self.layout.addWidget(self.polling_label)
         self.layout.addWidget(self.polling_slider)
 
+        self.idle_timeout_slider = QSlider(Qt.Horizontal)
+        self.idle_timeout_slider.setToolTip("How long the puck must be quiet before polling drops back to the idle rate")
+        self.idle_timeout_slider.setMinimum(100)
+        self.idle_timeout_slider.setMaximum(5000)
+        self.idle_timeout_slider.setValue(1000)
+        self.idle_timeout_slider.valueChanged.connect(self.update_idle_timeout)
+        self.idle_timeout_label = QLabel(f"Idle After: {self.idle_timeout_slider.value()}ms")
+        self.layout.addWidget(self.idle_timeout_label)
+        self.layout.addWidget(self.idle_timeout_slider)
+
+        self.scheduler_label = QLabel("Scheduler: not connected")
+        self.scheduler_label.setToolTip("Effective input rate and timer jitter over the last ticks")
+        self.scheduler_label.setWordWrap(True)
+        self.layout.addWidget(self.scheduler_label)
+        self.scheduler_stats_timer = QTimer(self)
+        self.scheduler_stats_timer.setInterval(500)
+        self.scheduler_stats_timer.timeout.connect(self.update_scheduler_stats)
+
         self.dead_zone_slider = QSlider(Qt.Horizontal)
         self.dead_zone_slider.setToolTip("Set base input threshold for all axes; per-axis settings adjust relative to this")
         self.dead_zone_slider.setMinimum(0)
@@ -57,7 +125,7 @@ class AdvancedTab(QWidget):
         self.layout.addWidget(self.long_press_slider)
 
         self.reset_button = QPushButton("Reset to Defaults")
-        self.reset_button.setToolTip("Restore polling rate, dead zone, sensitivity, debug level, and long press to defaults")
+        self.reset_button.setToolTip("Restore input mode, motion coalescing, zoom anchor, backend, polling rate, idle timeout, dead zone, sensitivity, debug level, and long press to defaults")
         self.reset_button.clicked.connect(self.reset_to_defaults)
         self.layout.addWidget(self.reset_button)
 
@@ -68,11 +136,15 @@ class AdvancedTab(QWidget):
 
     def update_global_dead_zone(self, value):
         self.dead_zone_label.setText(f"Global Dead Zone: {value}")
+        if self.parent.settings:
+            self.parent.settings.invalidate_axis_dispatch()
         self.parent.save_current_settings()
         debug_print(f"Global dead zone set to {value}", 1, debug_level=self.parent.debug_level_value)
 
     def update_global_sensitivity(self, value):
         self.sensitivity_label.setText(f"Global Sensitivity: {value}%")
+        if self.parent.settings:
+            self.parent.settings.invalidate_axis_dispatch()
         self.parent.save_current_settings()
         debug_print(f"Global sensitivity set to {value}%", 1, debug_level=self.parent.debug_level_value)
 
@@ -82,6 +154,50 @@ class AdvancedTab(QWidget):
         self.parent.save_current_settings()
         debug_print(f"Long press duration set to {value}ms", 1, debug_level=self.parent.debug_level_value)
 
+    def update_idle_timeout(self, value):
+        self.idle_timeout_label.setText(f"Idle After: {value}ms")
+        self.parent.idle_timeout = value
+        if hasattr(self.parent, 'extension'):
+            self.parent.extension.scheduler.idle_timeout = value
+        self.parent.save_current_settings()
+        debug_print(f"Idle timeout set to {value}ms", 1, debug_level=self.parent.debug_level_value)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update_scheduler_stats()
+        self.scheduler_stats_timer.start()
+
+    def hideEvent(self, event):
+        self.scheduler_stats_timer.stop()
+        super().hideEvent(event)
+
+    def update_scheduler_stats(self):
+        extension = getattr(self.parent, 'extension', None)
+        if not extension or not extension.connected:
+            text = "Scheduler: not connected"
+        elif extension.scheduler.suspended:
+            text = "Scheduler: suspended (Krita inactive or no document open)"
+        elif extension.reader:
+            reader = extension.reader
+            text = f"Reader thread: last GUI stall {reader.last_stall_ms:.1f}ms, max {reader.max_stall_ms:.1f}ms, {reader.dropped} dropped"
+        elif extension.notifier:
+            text = "Scheduler: event-driven, no polling timer"
+        else:
+            scheduler = extension.scheduler
+            state = "active" if scheduler.interval == ACTIVE_INTERVAL_MS else "idle"
+            stats = scheduler.stats()
+            text = f"Scheduler: {scheduler.interval}ms ({state})"
+            if stats:
+                text += f", effective {stats['rate_hz']:.0f}Hz, jitter avg {stats['jitter_mean_ms']:.2f}ms / max {stats['jitter_max_ms']:.2f}ms"
+        self.scheduler_label.setText(text)
+
+    def set_recording(self, path):
+        self.record_button.blockSignals(True)
+        self.record_button.setChecked(bool(path))
+        self.record_button.blockSignals(False)
+        self.record_button.setText("Stop Recording" if path else "Record")
+        self.record_label.setText(f"Recording to {path}" if path else "Not recording")
+
     def reset_to_defaults(self):
         # Set UI elements to default values
         self.polling_slider.setValue(10)
@@ -91,13 +207,17 @@ class AdvancedTab(QWidget):
         self.sensitivity_slider.setValue(100)
         self.sensitivity_label.setText(f"Global Sensitivity: 100%")
         self.debug_level.setCurrentIndex(1)  # "1 - Minimal"
+        self.input_mode.setCurrentIndex(self.input_mode.findData("notifier"))
+        self.coalescing_policy.setCurrentIndex(self.coalescing_policy.findData("mean"))
+        self.zoom_anchor.setCurrentIndex(self.zoom_anchor.findData("center"))
+        self.spnav_backend.setCurrentIndex(self.spnav_backend.findData("auto"))
         self.long_press_slider.setValue(500)
         self.long_press_label.setText(f"Long Press Duration: 500ms")
+        self.idle_timeout_slider.setValue(1000)
 
         # Update extension polling timer
         if hasattr(self.parent, 'extension'):
-            self.parent.extension.timer.stop()
-            self.parent.extension.timer.start(10)
+            self.parent.extension.set_polling_interval(10)
 
         # Save the reset settings
         self.parent.save_current_settings()
@@ -2,10 +2,8 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QLabel, QPushButton, QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QMessageBox
 from PyQt5.QtGui import QPixmap, QMouseEvent, QPen, QColor, QPainter
 from PyQt5.QtCore import Qt, QRectF, QEvent
-from krita import Krita
 from ..utils import debug_print
 from ..preset_dialog import SavePresetDialog
-from .curves_tab import CurvesTab
 import os
 
 class ButtonsTab(QWidget):
@@ -107,8 +105,6 @@ class ButtonsTab(QWidget):
         self.layout.addStretch()
         self.setLayout(self.layout)
 
-        self.refresh_available_actions()
-        debug_print(f"Available actions initialized with {len(self.available_actions)} items", 1, debug_level=self.parent.debug_level_value if self.parent.settings else 1)
         debug_print("ButtonsTab initialized", 1, debug_level=self.parent.debug_level_value if self.parent.settings else 1)
 
     def resizeEvent(self, event):
@@ -217,9 +213,5 @@ class ButtonsTab(QWidget):
             self.parent.settings.load_button_preset(preset_name)
             debug_print(f"Loaded preset: {preset_name}", 1, debug_level=self.parent.debug_level_value)
 
-    def refresh_available_actions(self):
-        self.available_actions = ["None"] + [action.objectName() for action in Krita.instance().actions() if action.objectName()]
-        debug_print(f"Refreshed available actions: {len(self.available_actions)} items", 1, debug_level=self.parent.debug_level_value if self.parent.settings else 1)
-
     def show_puck_config_dialog(self):
         self.parent.config_dialogs.show_puck_config()
@@ -1,7 +1,7 @@
 # curves_tab.py
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QComboBox, QLabel, QHBoxLayout, QPushButton
-from PyQt5.QtCore import QPointF
-from ..curves import BezierCurveEditor
+from PyQt5.QtCore import QPointF, QTimer
+from ..curves import BezierCurveEditor, MARKER_INTERVAL_MS
 from ..preset_dialog import SavePresetDialog
 from ..utils import debug_print
 
@@ -22,7 +22,7 @@ class CurvesTab(QWidget):
             "Fast Edges": [[0.0, 0.0], [0.1, 0.05], [0.9, 0.95], [1.0, 1.0]],
             "Controlled": [[0.0, 0.0], [0.8, 0.05], [0.95, 0.1], [1.0, 1.0]]  # Flattened for Zoom control
         }
-        self.custom_presets = {}
+        self.custom_presets = self.parent.settings.custom_curve_presets if self.parent.settings else {}
 
         self.curve_selector = QComboBox()
         self.curve_selector.addItems(["X", "Y", "Zoom", "Rotation"])
@@ -33,6 +33,7 @@ class CurvesTab(QWidget):
         self.preset_selector = QComboBox()
         self.preset_selector.addItem("Custom (Current)")
         self.preset_selector.addItems(self.stock_presets.keys())
+        self.preset_selector.addItems(self.custom_presets.keys())
         self.preset_selector.currentTextChanged.connect(self.apply_preset)
         self.layout.addWidget(QLabel("Preset:"))
         self.layout.addWidget(self.preset_selector)
@@ -52,12 +53,55 @@ class CurvesTab(QWidget):
             "Zoom": BezierCurveEditor(),
             "Rotation": BezierCurveEditor()
         }
-        for editor in self.curve_editors.values():
+        for axis, editor in self.curve_editors.items():
             editor.parent_widget = self.parent
+            if self.parent.settings:
+                # Built on first show, so start from the curves loaded into settings rather than the defaults
+                editor.control_points = [QPointF(x, y) for x, y in self.parent.settings.curve_points[axis]]
+                editor.bind_lut(self.parent.settings.curve_bank.table(axis))
+                editor.update_curve()
         self.current_curve_editor = self.curve_editors["X"]
         self.layout.addWidget(self.current_curve_editor)
         self.layout.addStretch()
 
+        # The live input marker samples the motion pipeline at a capped rate, only while this tab is visible
+        self.latest_sample = None
+        self.marker_timer = QTimer(self)
+        self.marker_timer.setSingleShot(True)
+        self.marker_timer.timeout.connect(self.update_input_marker)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        extension = getattr(self.parent, 'extension', None)
+        if extension and self.on_motion not in extension.motion_listeners:
+            extension.motion_listeners.append(self.on_motion)
+
+    def hideEvent(self, event):
+        extension = getattr(self.parent, 'extension', None)
+        if extension and self.on_motion in extension.motion_listeners:
+            extension.motion_listeners.remove(self.on_motion)
+        self.marker_timer.stop()
+        super().hideEvent(event)
+
+    def on_motion(self, sample):
+        # Runs on every coalesced motion tick; only remember the sample and make sure an update is due
+        self.latest_sample = sample
+        if not self.marker_timer.isActive():
+            self.marker_timer.start(MARKER_INTERVAL_MS)
+
+    def update_input_marker(self):
+        sample = self.latest_sample
+        if sample is None or not self.parent.settings:
+            return
+        target = self.curve_selector.currentText()
+        curve_input = None
+        for entry in self.parent.settings.axis_dispatch:
+            if entry.target == target:
+                # Same normalization the motion handler feeds the curve; 0 inside the dead zone
+                value = max(0.0, min(1.0, (abs(sample[entry.index]) - entry.dead_zone) * entry.inv_range))
+                curve_input = value if curve_input is None else max(curve_input, value)
+        self.current_curve_editor.set_marker(curve_input)
+
     def switch_curve(self, axis):
         self.layout.removeWidget(self.current_curve_editor)
         self.current_curve_editor.hide()
@@ -1,9 +1,63 @@
 # tabs/log_tab.py
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QPushButton, QHBoxLayout, QApplication
-from PyQt5.QtCore import Qt
-from ..utils import debug_print
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QListView, QPushButton, QHBoxLayout, QApplication, QComboBox, QLabel, QAbstractItemView
+from PyQt5.QtCore import Qt, QTimer, QAbstractListModel, QModelIndex, QSortFilterProxyModel
+from ..utils import debug_print, set_log_sink
 from collections import deque
 
+LOG_MAX_RECORDS = 1000
+LOG_FLUSH_INTERVAL_MS = 100
+
+class LogModel(QAbstractListModel):
+    """Bounded list of (level, text) log records; the view only renders the visible rows."""
+    LevelRole = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.records = deque()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.records)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        level, text = self.records[index.row()]
+        if role == Qt.DisplayRole:
+            return text
+        if role == self.LevelRole:
+            return level
+        return None
+
+    def append_records(self, records):
+        records = records[-LOG_MAX_RECORDS:]
+        overflow = len(self.records) + len(records) - LOG_MAX_RECORDS
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self.records.popleft()
+            self.endRemoveRows()
+        first = len(self.records)
+        self.beginInsertRows(QModelIndex(), first, first + len(records) - 1)
+        self.records.extend(records)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self.records.clear()
+        self.endResetModel()
+
+class LogLevelFilter(QSortFilterProxyModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.max_level = None  # None shows every level
+
+    def set_max_level(self, level):
+        self.max_level = level
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self.max_level is None or self.sourceModel().records[source_row][0] <= self.max_level
+
 class LogTab(QWidget):
     def __init__(self, parent):
         super().__init__()
@@ -11,9 +65,27 @@ class LogTab(QWidget):
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
 
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
-        self.layout.addWidget(self.log_text)
+        self.filter_layout = QHBoxLayout()
+        self.level_filter = QComboBox()
+        self.level_filter.setToolTip("Only show records up to this level")
+        self.level_filter.addItem("All Levels", None)
+        for level, name in enumerate(["Minimal", "Verbose", "Debug", "Full"], start=1):
+            self.level_filter.addItem(f"{level} - {name}", level)
+        self.level_filter.currentIndexChanged.connect(self.update_level_filter)
+        self.filter_layout.addWidget(QLabel("Show:"))
+        self.filter_layout.addWidget(self.level_filter)
+        self.filter_layout.addStretch()
+        self.layout.addLayout(self.filter_layout)
+
+        self.log_model = LogModel(self)
+        self.log_filter = LogLevelFilter(self)
+        self.log_filter.setSourceModel(self.log_model)
+        self.log_view = QListView()
+        self.log_view.setModel(self.log_filter)
+        self.log_view.setUniformItemSizes(True)
+        self.log_view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.log_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.layout.addWidget(self.log_view)
 
         self.button_layout = QHBoxLayout()
         self.freeze_button = QPushButton("Freeze")
@@ -28,33 +100,48 @@ class LogTab(QWidget):
         self.button_layout.addWidget(self.copy_button)
         self.layout.addLayout(self.button_layout)
 
+        # Records are buffered and pushed to the view in batches instead of one widget update per message
+        self.pending = []
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self.flush_log)
+
         self.log_frozen = False
-        self.log_buffer = deque(maxlen=1000)
-        debug_print("LogTab initialized with 1000-line buffer", 1, debug_level=self.parent.debug_level_value)
+        set_log_sink(self)
+        debug_print(f"LogTab initialized with {LOG_MAX_RECORDS}-line buffer", 1, debug_level=self.parent.debug_level_value)
 
     def toggle_freeze(self, checked):
         self.log_frozen = checked
         self.freeze_button.setText("Unfreeze" if checked else "Freeze")
         debug_print(f"Log {'frozen' if checked else 'unfrozen'}", 1, debug_level=self.parent.debug_level_value)
 
+    def update_level_filter(self, index):
+        self.log_filter.set_max_level(self.level_filter.itemData(index))
+
     def clear_log(self):
-        self.log_buffer.clear()
-        self.log_text.clear()
+        self.pending.clear()
+        self.log_model.clear()
         debug_print("Log cleared", 1, debug_level=self.parent.debug_level_value)
 
-    def append_log(self, message):
+    def append_log(self, message, level=1):
         if not self.log_frozen:
-            self.log_buffer.append(message)
-            cursor = self.log_text.textCursor()
-            cursor.movePosition(cursor.End)
-            cursor.insertText(message + "\n")
-            if len(self.log_buffer) == self.log_buffer.maxlen:
-                cursor.movePosition(cursor.Start)
-                cursor.movePosition(cursor.Down, cursor.KeepAnchor)
-                cursor.removeSelectedText()
-            self.log_text.ensureCursorVisible()
+            self.pending.append((level, message))
+            if not self.flush_timer.isActive():
+                self.flush_timer.start()
+
+    def flush_log(self):
+        if not self.pending:
+            return
+        scrollbar = self.log_view.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        self.log_model.append_records(self.pending)
+        self.pending = []
+        if at_bottom:
+            self.log_view.scrollToBottom()
 
     def copy_log(self):
+        self.flush_log()
         clipboard = QApplication.clipboard()
-        clipboard.setText("\n".join(self.log_buffer))
+        clipboard.setText("\n".join(self.log_filter.index(row, 0).data() for row in range(self.log_filter.rowCount())))
         debug_print("Log contents copied to clipboard", 1, debug_level=self.parent.debug_level_value)
@@ -0,0 +1,64 @@
+# thumbnail_cache.py
+import hashlib
+import os
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt5.QtGui import QImage
+
+THUMB_SIZE = 64
+THUMB_CACHE_DIR = os.path.expanduser("~/.cache/krita_spacemouse/thumbs")
+THUMB_THREADS = 2  # Krita's own global pool stays free
+
+def resource_key(resource):
+    # Prefer Krita's checksum so an edited preset gets a new thumbnail; older APIs lack md5sum
+    md5sum = getattr(resource, "md5sum", None)
+    if md5sum:
+        checksum = md5sum()
+        if checksum:
+            return checksum
+    return hashlib.sha1(f"{resource.filename()}\0{resource.name()}".encode("utf-8")).hexdigest()
+
+class ThumbnailTask(QRunnable):
+    def __init__(self, cache, key, image):
+        super().__init__()
+        self.cache = cache
+        self.key = key
+        self.image = image  # QImage, safe to use off the GUI thread unlike QPixmap
+
+    def run(self):
+        path = self.cache.path(self.key)
+        thumb = QImage(path) if os.path.exists(path) else QImage()
+        if thumb.isNull() and self.image is not None and not self.image.isNull():
+            thumb = self.image.scaled(THUMB_SIZE, THUMB_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            if thumb.save(temp_path, "PNG"):
+                os.replace(temp_path, path)
+        self.cache.ready.emit(self.key, thumb)
+
+class ThumbnailCache(QObject):
+    """Scales preset thumbnails on a thread pool and keeps them on disk, keyed by resource checksum."""
+    ready = pyqtSignal(str, QImage)
+
+    def __init__(self, directory=THUMB_CACHE_DIR):
+        super().__init__()
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(THUMB_THREADS)
+        self.pending = set()
+        self.ready.connect(self.finished)
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{key}.png")
+
+    def is_cached(self, key):
+        return os.path.exists(self.path(key))
+
+    def request(self, key, image=None):
+        # image may be None when the thumbnail is already on disk
+        if key in self.pending:
+            return
+        self.pending.add(key)
+        self.pool.start(ThumbnailTask(self, key, image))
+
+    def finished(self, key, image):
+        self.pending.discard(key)
@@ -0,0 +1,86 @@
+# transform.py
+import math
+from contextlib import contextmanager, nullcontext
+from PyQt5.QtGui import QCursor
+from .utils import debug_print
+
+ZOOM_STEP_FACTOR = 2 ** 0.25  # Ratio between Krita's discrete zoom steps, so the puck feels as before
+MIN_ZOOM_LOG_DELTA = 0.001  # Smaller zoom changes are carried over to the next tick
+MIN_ZOOM = 0.01
+MAX_ZOOM = 256.0
+
+@contextmanager
+def batched_updates(context):
+    # Hold back repaints while several view properties change, then repaint once
+    viewport = context.viewport
+    if viewport is None:
+        yield
+        return
+    viewport.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        viewport.setUpdatesEnabled(True)
+        viewport.update()
+
+class TransformAccumulator:
+    """Collects one tick's pan, zoom and rotation and commits them to the canvas together."""
+
+    def __init__(self, extension):
+        self.extension = extension
+        self.dx = self.dy = 0
+        self.rotation = 0
+        self.zoom_log = 0.0  # Natural-log zoom change; kept across ticks until it is worth applying
+
+    def pan(self, dx, dy):
+        self.dx += dx
+        self.dy += dy
+
+    def zoom(self, zoom_delta):
+        # zoom_delta keeps its old meaning: 10 units = one Krita zoom step
+        self.zoom_log += zoom_delta * 10 * math.log(ZOOM_STEP_FACTOR)
+
+    def rotate(self, degrees):
+        self.rotation += degrees
+
+    def commit(self, context):
+        extension = self.extension
+        canvas = context.canvas
+        dx, dy, rotation = self.dx, self.dy, self.rotation
+        self.dx = self.dy = self.rotation = 0
+
+        target_zoom = None
+        if abs(self.zoom_log) >= MIN_ZOOM_LOG_DELTA:
+            current = canvas.zoomLevel() / context.zoom_scale
+            target_zoom = max(MIN_ZOOM, min(MAX_ZOOM, current * math.exp(self.zoom_log)))
+            self.zoom_log = 0.0
+            if target_zoom == current:
+                target_zoom = None
+            elif extension.zoom_anchor == "cursor" and context.viewport:
+                # setZoomLevel keeps the view center still; fold the shift that keeps the point under
+                # the cursor still into this tick's pan so the scrollbars are only set once
+                cursor = context.viewport.mapFromGlobal(QCursor.pos())
+                if context.viewport.rect().contains(cursor):
+                    center = context.viewport.rect().center()
+                    ratio = target_zoom / current - 1.0
+                    dx += round((cursor.x() - center.x()) * ratio)
+                    dy += round((cursor.y() - center.y()) * ratio)
+
+        operations = (target_zoom is not None) + (rotation != 0) + (dx != 0) + (dy != 0)
+        if not operations:
+            return
+        # One change repaints once on its own; only batch when several would each schedule a repaint
+        with batched_updates(context) if operations > 1 else nullcontext():
+            # Zoom and rotation pivot on the view center, so apply them before panning in screen space
+            if target_zoom is not None:
+                canvas.setZoomLevel(target_zoom)
+            if rotation:
+                canvas.setRotation(canvas.rotation() + rotation)
+            if dx:
+                context.hscroll.setValue(context.hscroll.value() + dx)
+            if dy:
+                context.vscroll.setValue(context.vscroll.value() + dy)
+
+        debug_level = extension.docker.debug_level_value if extension.docker else 1
+        debug_print("Committed transform: pan=(%d, %d) zoom=%s rotation=%d", 1, debug_level=debug_level,
+                    args=(dx, dy, "%.4f" % target_zoom if target_zoom is not None else "-", rotation))
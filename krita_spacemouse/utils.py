@@ -1,77 +1,85 @@
 import os
 import json
+import tempfile
+import time
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
 
 CONFIG_PATH = os.path.expanduser("~/.local/share/krita/spacenav_plugin_config.json")
 
-last_logged_values = None
-zero_count = 0
-last_graph_values = None
-graph_zero_count = 0
+# Where log records are shown besides the console; the log tab registers itself via set_log_sink()
+_log_sink = None
+# Records emitted before the log tab exists (it is built when first shown), handed to it on registration
+LOG_BACKLOG = 1000
+_log_backlog = deque(maxlen=LOG_BACKLOG)
+# (phase, milliseconds) in the order the phases finished; see timed_phase()
+_startup_phases = []
+# Per-key state for collapsing repeated all-zero samples: key -> [last_values, repeat_count]
+_zero_repeats = {}
 
-def debug_print(message, level=1, debug_level=1, force=False):
+def set_log_sink(sink):
+    global _log_sink
+    _log_sink = sink
+    if sink is not None:
+        while _log_backlog:
+            sink.append_log(*_log_backlog.popleft())
+
+def debug_print(message, level=1, debug_level=1, force=False, args=None, fields=None):
+    # Gate on level before doing any work; pass args (for %-formatting) or a callable to defer formatting.
+    # fields={"values": (...)} marks a structured sample whose all-zero repeats are collapsed.
     if not force and debug_level < level:
         return
     timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-    log_message = f"[{timestamp}] [Level {level}] {message}"
+    if fields and "values" in fields:
+        if _collapse_zero_repeat(fields.get("key", message), fields["values"], timestamp, level):
+            return
+    if args is not None:
+        message = message % args
+    elif callable(message):
+        message = message()
+    _emit(f"[{timestamp}] [Level {level}] {message}", level)
+
+def _emit(log_message, level):
     print(log_message)  # Console fallback
+    sink = _log_sink
+    if sink is None:
+        _log_backlog.append((log_message, level))
+        return
     try:
-        from krita import Krita
-        docker = next((d for d in Krita.instance().dockers() if d.objectName() == "spacenavDocker"), None)
-        if docker and hasattr(docker, 'log_tab') and docker.log_tab and not docker.log_tab.log_frozen:
-            if level == 2 and ("Raw SN inputs" in message or "Motion data stored" in message or "Fetching stored motion data" in message):
-                try:
-                    values_str = message.split(": ", 1)[1]
-                    values = eval(values_str)
-                    all_zeros = all(v == 0 for v in values.values())
-                    global last_logged_values, zero_count
-                    if all_zeros:
-                        if last_logged_values == values:
-                            zero_count += 1
-                            return
-                        elif zero_count > 0:
-                            docker.log_tab.append_log(f"[{timestamp}] [Level 2] Previous all-zero inputs repeated {zero_count} times")
-                            zero_count = 0
-                    elif zero_count > 0:
-                        docker.log_tab.append_log(f"[{timestamp}] [Level 2] Previous all-zero inputs repeated {zero_count} times")
-                        zero_count = 0
-                    last_logged_values = values
-                    docker.log_tab.append_log(log_message)
-                except Exception:
-                    docker.log_tab.append_log(log_message)
-            elif level == 2 and "Graph updated" in message:
-                try:
-                    values_str = message.split(": ", 1)[1]
-                    x, y, z, r = map(float, values_str.split(", ")[0:4:1])[1::2]
-                    values = {"x": x, "y": y, "z": z, "r": r}
-                    all_zeros = all(v == 0 for v in values.values())
-                    global last_graph_values, graph_zero_count
-                    if all_zeros:
-                        if last_graph_values == values:
-                            graph_zero_count += 1
-                            return
-                        elif graph_zero_count > 0:
-                            docker.log_tab.append_log(f"[{timestamp}] [Level 2] Previous all-zero graph updates repeated {graph_zero_count} times")
-                            graph_zero_count = 0
-                    elif graph_zero_count > 0:
-                        docker.log_tab.append_log(f"[{timestamp}] [Level 2] Previous all-zero graph updates repeated {graph_zero_count} times")
-                        graph_zero_count = 0
-                    last_graph_values = values
-                    docker.log_tab.append_log(log_message)
-                except Exception:
-                    docker.log_tab.append_log(log_message)
-            else:
-                docker.log_tab.append_log(log_message)
-    except Exception:
-        pass  # Silent fail to console
+        if not sink.log_frozen:
+            sink.append_log(log_message, level)
+    except RuntimeError:
+        set_log_sink(None)  # Log tab was deleted with its docker
+
+def _collapse_zero_repeat(key, values, timestamp, level):
+    state = _zero_repeats.setdefault(key, [None, 0])
+    if state[0] == values and not any(values):
+        state[1] += 1
+        return True
+    if state[1] > 0:
+        _emit(f"[{timestamp}] [Level {level}] Previous all-zero values repeated {state[1]} times", level)
+        state[1] = 0
+    state[0] = values
+    return False
 
-def save_settings(settings):
+def write_settings_file(settings, path=None):
+    # Atomic replace: a crash mid-write leaves the previous config intact. No logging, safe off the GUI thread.
+    path = path or CONFIG_PATH
+    directory = os.path.dirname(path)
+    fd, temp_path = tempfile.mkstemp(prefix=".spacenav_plugin_config.", suffix=".tmp", dir=directory)
     try:
-        with open(CONFIG_PATH, 'w') as f:
+        with os.fdopen(fd, 'w') as f:
             json.dump(settings, f)
-        debug_print("Settings saved to " + CONFIG_PATH, 1, debug_level=1)
-    except Exception as e:
-        debug_print(f"Error saving settings: {e}", 1, debug_level=1)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
 
 def load_settings():
     try:
@@ -86,3 +94,18 @@ def load_settings():
     except Exception as e:
         debug_print(f"Error loading settings: {e}", 1, debug_level=1)
         return None
+
+@contextmanager
+def timed_phase(name):
+    # Records how long a startup phase took, for startup_report()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _startup_phases.append((name, (time.perf_counter() - start) * 1000.0))
+
+def startup_report():
+    total = sum(ms for _, ms in _startup_phases)
+    lines = [f"Startup timing: {total:.1f}ms over {len(_startup_phases)} phases"]
+    lines += [f"  {name}: {ms:.1f}ms" for name, ms in _startup_phases]
+    return "\n".join(lines)
@@ -0,0 +1,115 @@
+# view_context.py
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication, QMdiArea, QScrollBar, QAbstractScrollArea
+from krita import Krita
+from .utils import debug_print
+
+# canvas.zoomLevel() reports zoom in document resolution units (image ppi / 72) while setZoomLevel() takes
+# screen zoom; this is the 300 ppi ratio, used when the document resolution is unavailable
+ZOOM_SCALE_FACTOR = 4.17
+
+class ViewContext:
+    """Krita window/view/canvas/scrollbar handles, resolved once and reused until the active view changes."""
+
+    def __init__(self, extension):
+        self.extension = extension
+        self.valid = False
+        self.window = None
+        self.qwindow = None
+        self.mdi_area = None
+        self.subwindow = None
+        self.view = None
+        self.canvas = None
+        self.hscroll = None  # Pan scrollbars: the last of each orientation under the subwindow
+        self.vscroll = None
+        self.view_hscroll = None  # Stored views: the canvas scroll area's own scrollbars, None without a scroll area
+        self.view_vscroll = None
+        self.viewport = None
+        self.zoom_scale = ZOOM_SCALE_FACTOR
+        notifier = Krita.instance().notifier()
+        notifier.viewClosed.connect(self.invalidate)
+        notifier.viewCreated.connect(self.invalidate)
+        notifier.windowCreated.connect(self.invalidate)
+        QApplication.instance().focusWindowChanged.connect(self.invalidate)
+
+    def debug_level(self):
+        docker = self.extension.docker
+        return docker.debug_level_value if docker else self.extension.debug_level_value
+
+    def invalidate(self, *args):
+        if self.valid:
+            debug_print("View context invalidated", 2, debug_level=self.debug_level())
+        self.valid = False
+        self.view = None
+        self.canvas = None
+
+    def resolve(self):
+        # Cheap when valid: no Krita API calls and no object-tree walks
+        if self.valid:
+            return True
+        window = Krita.instance().activeWindow()
+        if not window:
+            return False
+        view = window.activeView()
+        if not view:
+            return False
+        qwin = window.qwindow()
+        mdi_area = qwin.findChild(QMdiArea)
+        subwindow = mdi_area.currentSubWindow() if mdi_area else None
+        if not subwindow:
+            debug_print("No subwindow found", 1, debug_level=self.debug_level())
+            return False
+        hscroll, vscroll = self._find_scrollbars(subwindow)
+        if not (hscroll and vscroll):
+            debug_print("Scrollbars not found", 1, debug_level=self.debug_level())
+            return False
+
+        self._watch(window, mdi_area)
+        self.qwindow = qwin
+        self.subwindow = subwindow
+        self.view = view
+        self.canvas = view.canvas()
+        document = view.document()
+        resolution = document.resolution() if document else 0
+        self.zoom_scale = resolution / 72.0 if resolution > 0 else ZOOM_SCALE_FACTOR
+        self.hscroll = hscroll
+        self.vscroll = vscroll
+        self.valid = True
+        debug_print("View context resolved", 2, debug_level=self.debug_level())
+        return True
+
+    def _find_scrollbars(self, subwindow):
+        # Two pairs, as the uncached paths picked them: panning used the last scrollbar of each orientation under
+        # the subwindow, store/recall view used the scroll area's own bars
+        widget = subwindow.widget()
+        scroll_area = widget.findChild(QAbstractScrollArea) if widget else None
+        self.viewport = scroll_area.viewport() if scroll_area else widget  # Used to anchor zoom at the cursor
+        self.view_hscroll = scroll_area.horizontalScrollBar() if scroll_area else None
+        self.view_vscroll = scroll_area.verticalScrollBar() if scroll_area else None
+        hscroll = vscroll = None
+        for sb in subwindow.findChildren(QScrollBar):
+            if sb.orientation() == Qt.Horizontal:
+                hscroll = sb
+            elif sb.orientation() == Qt.Vertical:
+                vscroll = sb
+        return hscroll, vscroll
+
+    def _watch(self, window, mdi_area):
+        # Keep a reference to the Window wrapper so its signal connections stay alive
+        if self.window is not None:
+            try:
+                self.window.activeViewChanged.disconnect(self.invalidate)
+                self.window.windowClosed.disconnect(self.invalidate)
+            except (TypeError, RuntimeError):
+                pass
+        self.window = window
+        window.activeViewChanged.connect(self.invalidate)
+        window.windowClosed.connect(self.invalidate)
+        if mdi_area is not self.mdi_area:
+            if self.mdi_area is not None:
+                try:
+                    self.mdi_area.subWindowActivated.disconnect(self.invalidate)
+                except (TypeError, RuntimeError):
+                    pass
+            mdi_area.subWindowActivated.connect(self.invalidate)
+            self.mdi_area = mdi_area